@@ -5,12 +5,22 @@ Script that takes in configuration and outputs excel documents with the followin
     - Fund Performance
 """
 from lib.config import Config
-from lib.scraper import Scraper
 from lib.parser import Parser
+from lib.panel_parser import PanelParser
 from lib.formatter import Formatter
 from lib.portfolio_optimizer import portfolioOptimizer
+from lib.rolling_metrics import RollingMetrics
+from lib.risk_metrics import RiskMetrics
+from lib.backtester import Backtester
+from lib.walk_forward import WalkForward
+from lib.stage_graph import StageGraph
+from lib.reader import Reader
+from lib.fund_pipeline import FundPipeline
+from lib.work_queue import WorkQueue
 import os
 import sys
+import time
+import subprocess
 import traceback
 import pandas as pd
 import numpy as np
@@ -20,6 +30,75 @@ from datetime import datetime as dt
 
 # -------------------------------------------#
 
+# Stage Functions (called through the StageGraph, which skips them when their inputs and configuration are unchanged)
+
+def panel_stage(scrapes):
+    fields = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+    naive = lambda s: s.tz_localize(None) if getattr(s.index, "tz", None) is not None else s
+    prices = {f: pd.DataFrame({t: naive(scrapes[t].prices[f]) for t in scrapes}) for f in fields}
+    dividends = pd.DataFrame({t: naive(scrapes[t].dividends).groupby(lambda d: d.normalize()).sum() for t in scrapes if len(scrapes[t].dividends) > 0})
+    panel = PanelParser(prices, dividends)
+    panel.get_monthly_data()
+    panel.get_reinvestment_metrics(config.func_args["start_cap"], config.func_args["start_dt"])
+    panel.get_performance(config.func_args["req_ret"])
+    return panel
+
+def rolling_stage(rolling):
+    rolling.get_rolling_metrics()
+    return rolling
+
+def daily_returns(scrapes):
+    naive = lambda s: s.tz_localize(None) if getattr(s.index, "tz", None) is not None else s
+    close = pd.DataFrame({t: naive(scrapes[t].prices["Close"]) for t in scrapes}).sort_index()
+    close.index = close.index.normalize()
+    dividends = pd.DataFrame({t: naive(scrapes[t].dividends).groupby(lambda d: d.normalize()).sum() for t in scrapes if len(scrapes[t].dividends) > 0})
+    dividends = dividends.reindex(index=close.index, columns=close.columns).fillna(0)
+    returns = (close + dividends) / close.ffill().shift(1) - 1
+    returns.index.name = "Date"
+    return returns
+
+def risk_stage(returns_df):
+    risk = RiskMetrics(returns_df, config.func_args["rf_rate"], 252 if config.func_args["risk_freq"] == "daily" else 12)
+    risk.get_risk_metrics()
+    return risk
+
+def report_stage(formatting, rolling_df):
+    formatting.output_excel(config.func_args["start_dt"], config.func_args["start_cap"], config.func_args["req_ret"])
+    formatting.output_rolling(rolling_df)
+    return formatting.path
+
+def optimize_stage(ret_df, cov_df, universe):
+    opt = portfolioOptimizer(config.func_args["rf_rate"], os.path.join(config.cache_cfg["location"], "optimizer_solutions.json"), universe)
+    sharpe_weights = opt.maximize_Sharpe(ret_df, cov_df)
+    max_ret_weights = opt.maximize_return(ret_df, cov_df, config.func_args["opt_vol"])
+    min_vol_weights = opt.minimize_volatility(ret_df, cov_df, config.func_args["opt_ret"])
+    weights_dict = {"Sharpe - ":sharpe_weights, "Max Return - ": max_ret_weights, "Min Volatility - ": min_vol_weights}
+    optimized = pd.DataFrame({'Strategy':opt.strategy, 'Portfolio Return':opt.return_list, 'Portfolio Volatility':opt.risk, 'Portfolio Sharpe':opt.sharpe})
+    optimized = pd.merge(optimized, pd.DataFrame(opt.stats), on='Strategy')
+    return {"weights": weights_dict, "optimized": optimized}
+
+def backtest_stage(returns_df, weights_matrix):
+    backtest = Backtester(returns_df, config.func_args["rf_rate"], config.func_args["trans_cost"])
+    for freq in config.func_args["rebal_freq"].split(","):
+        backtest.run(weights_matrix, freq.strip())
+    return backtest
+
+def walk_forward_stage(returns_df):
+    walk = WalkForward(returns_df, config.func_args["rf_rate"])
+    walk.get_windows(config.func_args["wf_train"], config.func_args["wf_test"], config.func_args["wf_mode"])
+    walk.run(config.func_args["opt_ret"])
+    solved = int((walk.results["Status"] == "OK").sum()) if "Status" in walk.results else 0
+    logger.info(f"Walk-forward optimization solved {solved} of {walk.results.shape[0]} strategy windows across {len(walk.windows)} windows")
+    return walk
+
+def summary_stage(formatting, summary_df, optimized, less_one_year, config_long, backtest, walk):
+    formatting.output_summary(summary_df, optimized, less_one_year, config_long)
+    formatting.output_backtest(backtest.results, backtest.equity, backtest.drawdown)
+    formatting.output_walk_forward(walk.results, walk.weights)
+    return formatting.sumpath
+
+# -------------------------------------------#
+
 # Step 0: Initialize Logger
 
 ## Getting Current Date and Time
@@ -44,21 +123,13 @@ except Exception as e:
 
 # Step 2: Read in Input Metrics
 
-logger.info("Step 2 Begins - Verifying and Reading Input File")
+logger.info("Step 2 Begins - Verifying and Reading Input Files")
 try:
-    input_dir = config.input_cfg["location"]
-
-    ## Checking Number of Files
-    assert len(os.listdir(input_dir)) == 1, "Too many input files in the directory"
-
-    ## Checking File Naming Convention
-    input_file = os.listdir(input_dir)[0]
-    assert input_file[:len(config.input_cfg["prefix"])] == config.input_cfg["prefix"], "Naming Convention is Incorrect"
-    assert input_file[-len(config.input_cfg["extension"]):] == config.input_cfg["extension"], "Naming Convention is Incorrect"
-
-    ## Reading in Input File
-    input_path = os.path.join(input_dir, input_file)
-    fund_tickers = pd.read_excel(input_path)["Tickers"].tolist()
+    ## Reading Every Universe File and Deduplicating Tickers
+    reader = Reader(config.input_cfg)
+    reader.get_universes()
+    fund_tickers = reader.tickers
+    logger.info(f"Read {len(reader.universes)} universes with {len(fund_tickers)} distinct tickers")
 
 except Exception as e:
     logger.error(f"Step 2 failed with the following message - {traceback.format_exc()}")
@@ -72,131 +143,207 @@ try:
     ## Date Information
     cd = dt.now().year
     sd = dt.strptime(config.func_args["start_dt"], "%d/%m/%Y").year
-
-    ## Summary Data Lists/DFs
-    tickers = list()
-    geom_ret = list()
-    std_ret = list()
-    years = list()
-    forward_div_rate = list()
-    forward_div_yield = list()
-    curr_price = list()
-    longnames = list()
-    categories = list()
+    today = dt.strftime(dt.date(dt.now()), "%Y-%m-%d")
+
+    ## Stage Graph and Per-Ticker Pipeline
+    graph = StageGraph(config.cache_cfg, config.func_args)
+    pipeline = FundPipeline(graph, config.func_args)
+
+    ## Sharded Mode: Distributing Tickers Through the Work Queue
+    ### Workers (fund_worker.py, on this or other nodes sharing the stage cache location) write every ticker's
+    ### stages to the stage cache, so the per-ticker loop below only reads their stored results
+    if config.func_args["sharded"]:
+        queue = WorkQueue(os.path.join(config.cache_cfg["location"], "work_queue.sqlite"))
+        run_id = queue.enqueue(fund_tickers, today)
+        worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fund_worker.py")
+        workers = [subprocess.Popen([sys.executable, worker_script, run_id]) for _ in range(config.func_args["local_workers"])]
+        logger.info(f"Queued {len(fund_tickers)} tickers as run {run_id} with {len(workers)} local workers")
+
+        ### The coordinator works the queue as well, and reclaims tickers from workers whose lease expired
+        counts = queue.progress(run_id)
+        while counts["pending"] + counts["running"] > 0:
+            pipeline.work(queue, run_id)
+            time.sleep(5)
+            counts = queue.progress(run_id)
+        for w in workers:
+            w.wait()
+        logger.info(f"All shards finished - {counts['done']} done, {counts['failed']} failed")
+
+        ### Leaving Out Tickers the Queue Gave Up On (they are not fetched again here)
+        failed_tickers = queue.failed(run_id)
+        for ticker in failed_tickers:
+            logger.warning(f"{ticker} failed in every attempt and is left out of all universes - {failed_tickers[ticker]}")
+        fund_tickers = [t for t in fund_tickers if t not in failed_tickers]
+
+    ## Per-Fund Summary Data (shared by every universe)
+    fund_stats = dict()
+    fund_names = dict()
     less_than_one = list()
 
     ## Preparing for Portfolio Analysis
     i = np.arange(sd, cd, 1)
-    yearly_ret = pd.DataFrame(index=range(len(i)))
+    yearly_cols = dict()
 
-    ## Calculating per-fund perfomance 
+    ## Preparing for Rolling Metrics
+    rolling = RollingMetrics()
+    parsers = dict()
+
+    ## Fetching each distinct ticker once (data is refetched once per day)
+    scrapes = {ticker: pipeline.fetch(ticker, today) for ticker in fund_tickers}
+
+    ## Panel Mode: Evaluating All Funds at Once
+    if config.func_args["panel"]:
+        panel = graph.run("panel", "all-funds", {"fetch": scrapes}, lambda: panel_stage(scrapes))
+
+    ## Calculating per-fund perfomance
     for ticker in fund_tickers:
-        scrape = Scraper()
-        scrape.get_data(ticker)
-        parse = Parser(scrape.ticker, scrape.prices)
-        parse.get_monthly_data()
-        parse.get_reinvestment_metrics(config.func_args["start_cap"], config.func_args["start_dt"])
-        parse.get_performance(config.func_args["req_ret"])
-        formatting = Formatter(ticker, config.output_cfg, config.summary_cfg, parse.monthly_data, parse.reinvestment_data, parse.investment_performance)
-        formatting.output_excel(config.func_args["start_dt"], config.func_args["start_cap"], config.func_args["req_ret"])
+        scrape = scrapes[ticker]
+        if config.func_args["panel"]:
+            parse = Parser(scrape, scrape.prices)
+            parse.monthly_data = panel.monthly_data[ticker]
+            parse.reinvestment_data = panel.reinvestment_data[ticker]
+            parse.start_date = panel.start_date[ticker]
+            parse.start_shares = panel.start_shares[ticker]
+            parse.start_val = panel.start_val[ticker]
+            parse.investment_performance = panel.investment_performance[ticker]
+        else:
+            parse = pipeline.parse(ticker, scrape)
+        rolling.add_fund(ticker, parse.monthly_data)
+        parsers[ticker] = parse
 
-        ## Adding to Summary Data Lists
+        ## Adding to Summary Data
         if parse.investment_performance.shape[0] > 1:
-            tickers.append(ticker)
-            geom_ret.append(round(float(parse.investment_performance["Geometric Return w/ Reinvestment"][-1:].values[0]), 4))
-            std_ret.append(round(float(parse.investment_performance["Rate w/ Reinvestment"].std()/100), 4))
-            years.append(int(parse.investment_performance["Geometric Return w/ Reinvestment"].count()))
-            forward_div_rate.append(scrape.ticker.info["dividendRate"])
-            forward_div_yield.append(round(scrape.ticker.info["dividendYield"], 4))
-            longnames.append(scrape.ticker.info["longName"])
+            fund_stats[ticker] = {"Ticker": ticker,
+                                  "Geometric Return": round(float(parse.investment_performance["Geometric Return w/ Reinvestment"][-1:].values[0]), 4),
+                                  "Standard Deviation of Returns": round(float(parse.investment_performance["Rate w/ Reinvestment"].std()/100), 4),
+                                  "Number of Full Years": int(parse.investment_performance["Geometric Return w/ Reinvestment"].count()),
+                                  "Current Price": scrape.prices["Close"][-1:].values[0],
+                                  "Annual Dividend Amt": scrape.info["dividendRate"],
+                                  "Current Annual Dividend Yield": round(scrape.info["dividendYield"], 4)}
 
             ### Sectors and Categories
-            if scrape.ticker.info["quoteType"] == "EQUITY":
-                categories.append(scrape.ticker.info["sector"])
-            elif scrape.ticker.info["quoteType"] == "ETF":
-                categories.append(scrape.ticker.info["category"])
+            if scrape.info["quoteType"] == "EQUITY":
+                category = scrape.info["sector"]
+            elif scrape.info["quoteType"] == "ETF":
+                category = scrape.info["category"]
             else:
-                categories.append("N/A")
-            curr_price.append(scrape.prices["Close"][-1:].values[0])
+                category = "N/A"
+            fund_names[ticker] = {"Full Security Name": scrape.info["longName"], "Category": category}
             n = parse.investment_performance["Rate w/ Reinvestment"].to_numpy()[1:]/100
-            temp_df = pd.DataFrame({ticker: np.hstack((np.zeros(len(i)-len(n)) + np.nan, n))})
-            yearly_ret = pd.concat([yearly_ret, temp_df], axis=1) 
+            yearly_cols[ticker] = np.hstack((np.zeros(len(i)-len(n)) + np.nan, n))
         else:
             less_than_one.append(ticker)
 
+    ## Calculating Rolling Metrics for All Funds at Once
+    rolling = graph.run("rolling", "all-funds", {"monthly": {t: parsers[t].monthly_data for t in parsers}}, lambda: rolling_stage(rolling))
 
-    ## Calculating Optimal Portfolios
-    cov_df = yearly_ret.cov()
-    print(cov_df)
-    ret_df = pd.Series(geom_ret, index = tickers)
-    opt = portfolioOptimizer(config.func_args["rf_rate"])
-
-    ### File Paths
-    sharpe_weight_path = os.path.join(formatting.sumloc, f"sharpe-optimal-weights-{formatting.date}.csv")
-    vol_weight_path = os.path.join(formatting.sumloc, f"req-vol-optimal-weights-{formatting.date}.csv")
-    ret_weight_path = os.path.join(formatting.sumloc, f"req-ret-optimal-weights-{formatting.date}.csv")
-
-    ### Optimizing
-    sharpe_weights = opt.maximize_Sharpe(ret_df, cov_df)
-    max_ret_weights = opt.maximize_return(ret_df, cov_df, config.func_args["opt_vol"])
-    min_vol_weights = opt.minimize_volatility(ret_df, cov_df, config.func_args["opt_ret"])
-    weights_dict = {"Sharpe - ":sharpe_weights, "Max Return - ": max_ret_weights, "Min Volatility - ": min_vol_weights}
-
-    ### Formatting Performance
-    optimized = pd.DataFrame({'Strategy':opt.strategy, 'Portfolio Return':opt.return_list, 'Portfolio Volatility':opt.risk, 'Portfolio Sharpe':opt.sharpe})
-
-    ## Formatting summary dataframes
-    summary_df = pd.DataFrame({"Ticker": tickers,
-                               "Geometric Return": geom_ret,
-                               "Standard Deviation of Returns": std_ret,
-                               "Number of Full Years": years,
-                               "Current Price": curr_price,
-                               "Annual Dividend Amt": forward_div_rate,
-                               "Current Annual Dividend Yield": forward_div_yield})
-    less_one_year = pd.DataFrame({"Ticker":less_than_one})
-
-    for di in weights_dict:
-        df = weights_dict[di]
-        summary_df = pd.merge(summary_df, df, on='Ticker')
-        summary_df[di+"$ invested"] = summary_df[di.split("-")[0] + "Weights"] * config.func_args["port_cap"]
-        summary_df[di+"Num Shares"] = summary_df.apply(lambda x: math.trunc(x[di+"$ invested"] / x["Current Price"]), axis=1)
-        summary_df[di+"Annual Dividend"] = summary_df.apply(lambda x: round(x["Annual Dividend Amt"] * x[di+"Num Shares"], 2), axis=1)
-    
-    summary_df["Full Security Name"] = longnames
-    summary_df["Category"] = categories
-
-
-    ### Adding Correlation Analysis
-    summary_df.set_index("Ticker", inplace=True)
-    count_list = list()
-    ticker_list = list()
-    for idx in range(0, len(summary_df)):
-        sym = summary_df.index[idx]
-        bool = cov_df[[sym]].apply(lambda x: x/(yearly_ret[[sym]].std().iloc[0]*yearly_ret[[x.name]].std().iloc[0]), axis=1) > config.func_args["corr_cutoff"]
-        count_list.append(cov_df[[sym]][bool].count().iloc[0] - 1) # have to subtract to account for its own correlation being 1
-        ti_list = cov_df[[sym]][bool].dropna().index.to_list()
-        ti_list.remove(sym) # have to remove itself from the list
-        ticker_list.append(ti_list)
-
-    corr_anal = pd.DataFrame({"Ticker": summary_df.index.to_list(),
-                               f"Corr Above {config.func_args["corr_cutoff"]}":count_list, 
-                               "Offending Tickers": ticker_list})
-    summary_df.reset_index(inplace=True)
-    summary_df = pd.merge(summary_df, corr_anal, on="Ticker")
+    ## Calculating Drawdown and Downside Risk for All Funds at Once
+    total_returns = daily_returns(scrapes) if config.func_args["risk_freq"] == "daily" else rolling.returns
+    risk = graph.run("risk", "all-funds", {"total_returns": total_returns}, lambda: risk_stage(total_returns))
 
+    ## Writing Per-Fund Reports (unchanged workbooks are not rewritten)
+    for ticker in parsers:
+        parse = parsers[ticker]
+        formatting = Formatter(ticker, config.output_cfg, config.summary_cfg, parse.monthly_data, parse.reinvestment_data, parse.investment_performance)
+        report_inputs = {"target": formatting.path, "monthly": parse.monthly_data, "reinvestment": parse.reinvestment_data, "performance": parse.investment_performance, "rolling": rolling.metrics[ticker]}
+        graph.run("report", ticker, report_inputs, lambda: report_stage(formatting, rolling.metrics[ticker]))
 
     ## Saving Configuration Snapshot
     config_wide = pd.DataFrame(config.func_args, index=[0])
     config_wide["id"] = config_wide.index
     config_long = config_wide.melt(id_vars='id', var_name = "Configuration", value_name = "Value").drop("id", axis=1)
 
-    ## Save Summary File
-    formatting.output_summary(summary_df, optimized, less_one_year, config_long)
-
 except Exception as e:
     logger.error(f"Step 3 failed with the following message - {traceback.format_exc()}")
     sys.exit(1)
 
-logger.info("Script Finished. Have a nice day!")
-
+# Step 4: Optimize and Summarize Each Universe from the Shared Fund Results
+
+logger.info("Step 4 Begins - Optimizing and Summarizing Each Universe")
+failed = list()
+for universe in reader.universes:
+    try:
+        ## Selecting the Universe's Funds
+        tickers = [t for t in reader.universes[universe] if t in fund_stats]
+        less_one_year = pd.DataFrame({"Ticker": [t for t in reader.universes[universe] if t in less_than_one]})
+        yearly_ret = pd.DataFrame({t: yearly_cols[t] for t in tickers}, index=range(len(i)))
+        formatting = Formatter(None, config.output_cfg, config.summary_cfg, None, None, None, universe=universe)
+
+        ## Calculating Optimal Portfolios
+        cov_df = graph.run("covariance", universe, {"yearly_returns": yearly_ret}, lambda: yearly_ret.cov())
+        print(cov_df)
+        ret_df = pd.Series([fund_stats[t]["Geometric Return"] for t in tickers], index = tickers)
+
+        ### File Paths
+        sharpe_weight_path = os.path.join(formatting.sumloc, f"sharpe-optimal-weights-{formatting.date}.csv")
+        vol_weight_path = os.path.join(formatting.sumloc, f"req-vol-optimal-weights-{formatting.date}.csv")
+        ret_weight_path = os.path.join(formatting.sumloc, f"req-ret-optimal-weights-{formatting.date}.csv")
+
+        ### Measuring Risk as Downside Deviation Instead (the yearly covariance is still used for correlations)
+        opt_cov = risk.get_semicovariance(tickers) if config.func_args["downside_opt"] else cov_df
+        excluded = [t for t in tickers if t not in opt_cov.index]
+        if len(excluded) > 0:
+            logger.warning(f"{excluded} share no return dates with other funds in universe {universe} and get no weight")
+
+        ### Optimizing and Formatting Performance (the optimizer keeps its own solution cache, so it is not a graph stage)
+        optimization = optimize_stage(ret_df[opt_cov.index], opt_cov, universe)
+        weights_dict = optimization["weights"]
+        optimized = optimization["optimized"]
+
+        ### Backtesting Optimized Weights
+        weights_matrix = pd.concat([weights_dict[di].set_index("Ticker").iloc[:, 0].rename(di.split(" -")[0]) for di in weights_dict], axis=1)
+        backtest = graph.run("backtest", universe, {"monthly_returns": rolling.returns, "weights": weights_matrix}, lambda: backtest_stage(rolling.returns, weights_matrix))
+
+        ### Walk-Forward Optimization on Monthly Returns
+        wf_returns = rolling.returns[tickers]
+        walk = graph.run("walk_forward", universe, {"monthly_returns": wf_returns}, lambda: walk_forward_stage(wf_returns))
+
+        ## Formatting summary dataframes
+        summary_df = pd.DataFrame([fund_stats[t] for t in tickers], columns=["Ticker", "Geometric Return", "Standard Deviation of Returns", "Number of Full Years", "Current Price", "Annual Dividend Amt", "Current Annual Dividend Yield"])
+        summary_df = pd.merge(summary_df, rolling.latest, on="Ticker", how="left")
+        summary_df = pd.merge(summary_df, risk.metrics, on="Ticker", how="left")
+
+        for di in weights_dict:
+            df = weights_dict[di]
+            summary_df = pd.merge(summary_df, df, on='Ticker', how='left')
+            summary_df[di.split("-")[0] + "Weights"] = summary_df[di.split("-")[0] + "Weights"].fillna(0)
+            summary_df[di+"$ invested"] = summary_df[di.split("-")[0] + "Weights"] * config.func_args["port_cap"]
+            summary_df[di+"Num Shares"] = summary_df.apply(lambda x: math.trunc(x[di+"$ invested"] / x["Current Price"]), axis=1)
+            summary_df[di+"Annual Dividend"] = summary_df.apply(lambda x: round(x["Annual Dividend Amt"] * x[di+"Num Shares"], 2), axis=1)
+        
+        summary_df["Full Security Name"] = [fund_names[t]["Full Security Name"] for t in summary_df["Ticker"]]
+        summary_df["Category"] = [fund_names[t]["Category"] for t in summary_df["Ticker"]]
+
+
+        ### Adding Correlation Analysis
+        summary_df.set_index("Ticker", inplace=True)
+        count_list = list()
+        ticker_list = list()
+        for idx in range(0, len(summary_df)):
+            sym = summary_df.index[idx]
+            bool = cov_df[[sym]].apply(lambda x: x/(yearly_ret[[sym]].std().iloc[0]*yearly_ret[[x.name]].std().iloc[0]), axis=1) > config.func_args["corr_cutoff"]
+            count_list.append(cov_df[[sym]][bool].count().iloc[0] - 1) # have to subtract to account for its own correlation being 1
+            ti_list = cov_df[[sym]][bool].dropna().index.to_list()
+            ti_list.remove(sym) # have to remove itself from the list
+            ticker_list.append(ti_list)
+
+        corr_anal = pd.DataFrame({"Ticker": summary_df.index.to_list(),
+                                   f"Corr Above {config.func_args["corr_cutoff"]}":count_list, 
+                                   "Offending Tickers": ticker_list})
+        summary_df.reset_index(inplace=True)
+        summary_df = pd.merge(summary_df, corr_anal, on="Ticker")
+
+        ## Save Summary File
+        ### (fingerprinted on the portfolio results only, so solve times and cache hits alone do not rewrite the summary)
+        summary_inputs = {"target": formatting.sumpath, "summary": summary_df, "optimized": optimized[["Strategy", "Portfolio Return", "Portfolio Volatility", "Portfolio Sharpe"]], "less_one_year": less_one_year, "configuration": config_long, "backtest": backtest.results, "walk_forward": walk.results}
+        graph.run("summary", universe, summary_inputs, lambda: summary_stage(formatting, summary_df, optimized, less_one_year, config_long, backtest, walk))
+
+    except Exception as e:
+        logger.error(f"Step 4 failed for universe {universe} with the following message - {traceback.format_exc()}")
+        failed.append(universe)
+
+logger.info(f"Stage graph recomputed {len(graph.computed)} and reused {len(graph.skipped)} stage outputs")
+if len(failed) > 0:
+    sys.exit(1)
 
+logger.info("Script Finished. Have a nice day!")
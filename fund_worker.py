@@ -0,0 +1,56 @@
+"""
+Script that runs a sharded worker for fund_returns.py. It claims tickers from the work queue in the stage cache
+location and writes each ticker's fetch and parse stages to the shared stage cache, until the queue is empty.
+Start as many as needed, on this or other nodes that share config.json and the stage cache location.
+The run id to work on can be given as the first argument, otherwise the most recently queued run is used.
+"""
+from lib.config import Config
+from lib.stage_graph import StageGraph
+from lib.fund_pipeline import FundPipeline
+from lib.work_queue import WorkQueue
+import os
+import sys
+import traceback
+import logging
+from datetime import datetime as dt
+
+# -------------------------------------------#
+
+# Step 0: Initialize Logger
+
+## Getting Current Date and Time
+datetime = dt.strftime(dt.now(), "%Y%m%d_%H%M%S")
+logger = logging.getLogger(__name__)
+log_file_path = os.path.join("__LOG FILE DIR__", f'fund_worker_log_{datetime}_{os.getpid()}.log')
+logging.basicConfig(encoding='utf-8',
+                    datefmt='%m/%d/%Y %I:%M:%S %p',
+                    format = '%(asctime)s - %(levelname)s: %(message)s',
+                    handlers=[logging.FileHandler(log_file_path)],
+                    level=logging.INFO)
+
+# Step 1: Call Configuration Class
+
+logger.info("Step 1 Begins - Loading in Configuration")
+try:
+    config = Config()
+    config.get_config()
+except Exception as e:
+    logger.error(f"Step 1 failed with the following message - {traceback.format_exc()}")
+    sys.exit(1)
+
+# Step 2: Work the Queue
+
+logger.info("Step 2 Begins - Processing Tickers from the Work Queue")
+try:
+    graph = StageGraph(config.cache_cfg, config.func_args)
+    pipeline = FundPipeline(graph, config.func_args)
+    queue = WorkQueue(os.path.join(config.cache_cfg["location"], "work_queue.sqlite"))
+    run_id = sys.argv[1] if len(sys.argv) > 1 else queue.latest_run()
+    logger.info(f"Working on run {run_id}")
+    done, failed = pipeline.work(queue, run_id)
+    logger.info(f"Worker {pipeline.worker} finished - {done} tickers done, {failed} failed")
+except Exception as e:
+    logger.error(f"Step 2 failed with the following message - {traceback.format_exc()}")
+    sys.exit(1)
+
+logger.info("Worker Finished. Have a nice day!")
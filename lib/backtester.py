@@ -0,0 +1,118 @@
+"""
+Import Statements Necessary for Historical Backtesting of Portfolio Weights
+"""
+import pandas as pd
+import numpy as np
+# -------------------------------------------#
+"""
+Class: Backtester
+Purpose: To simulate how sets of optimized portfolio weights would have performed historically with periodic rebalancing
+"""
+class Backtester():
+
+    def __init__(self, returns_df, rf_rate, transaction_cost=0):
+        """
+        Initializing the attributes of the class.
+            returns_df - monthly total returns (month-end dates x tickers), e.g. RollingMetrics.returns
+            rf_rate - annual risk-free rate in percent
+            transaction_cost - cost in percent of every dollar traded at a rebalance
+        """
+        # Input Attributes
+        self.returns = returns_df
+        self.rf_rate = rf_rate/100
+        self.cost = transaction_cost/100
+        self.months = {"monthly": list(range(1, 13)), "quarterly": [1, 4, 7, 10], "annual": [1]}
+
+        # Attribute Placeholders
+        self.equity = dict()
+        self.drawdown = dict()
+        self.results = pd.DataFrame()
+
+# -------------------------------------------#
+
+    def run(self, weights_df, frequency):
+        """
+        Backtests every weight set (column) of weights_df (tickers x strategies) at once and appends a row per strategy to self.results.
+        Rebalancing happens at the start of each month, quarter, or year according to the frequency.
+        The backtest covers the months where every fund with a non-zero weight has a return.
+        """
+        # Step 0: Validate Frequency
+        assert frequency in self.months, f"Invalid rebalancing frequency: {frequency}"
+
+        # Step 1: Align Weights and Returns
+        weights_df = weights_df.fillna(0)
+        weights_df = weights_df.loc[(weights_df != 0).any(axis=1)]
+        rets = self.returns[weights_df.index.tolist()]
+        rets = rets.loc[rets.notna().all(axis=1)]
+        assert rets.shape[0] > 0, "No common return history for the weighted funds"
+
+        W = weights_df.to_numpy(dtype=float)
+        W = W / W.sum(axis=0)
+        R = rets.to_numpy(dtype=float)
+        dates = rets.index
+        T = R.shape[0]
+
+        # Step 2: Flag Rebalancing Months
+        start = np.isin(dates.month, self.months[frequency])
+        start[0] = True
+        block = np.cumsum(start) - 1
+
+        # Step 3: Asset Growth Since the Last Rebalance (resets at every block start)
+        log_g = np.log1p(R)
+        cum_log = np.cumsum(log_g, axis=0)
+        block_base = np.vstack((np.zeros((1, R.shape[1])), cum_log))[np.where(start)[0]]
+        G = np.exp(cum_log - block_base[block])
+
+        ## Portfolio Growth Since the Last Rebalance for Every Weight Set
+        P = G @ W
+        P_prev = np.vstack((np.ones((1, W.shape[1])), P[:-1]))
+        P_prev[start] = 1
+        port_ret = P / P_prev - 1
+
+        # Step 4: Transaction Costs at Rebalances (turnover between drifted and target weights)
+        turnover = np.zeros((T, W.shape[1]))
+        ends = np.where(np.append(start[1:], False))[0]
+        if len(ends) > 0:
+            drifted = (G[ends][:, :, None] * W[None, :, :]) / P[ends][:, None, :]
+            turnover[ends + 1] = np.abs(drifted - W[None, :, :]).sum(axis=1)
+        port_ret = (1 + port_ret) * (1 - self.cost*turnover) - 1
+
+        # Step 5: Equity Curve and Drawdowns
+        equity = np.cumprod(1 + port_ret, axis=0)
+        drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+        self.equity[frequency] = pd.DataFrame(equity, index=dates, columns=weights_df.columns)
+        self.drawdown[frequency] = pd.DataFrame(drawdown, index=dates, columns=weights_df.columns)
+
+        # Step 6: Realized Performance
+        years = T / 12
+        excess = port_ret - self.rf_rate/12
+        vol = port_ret.std(axis=0, ddof=1) * np.sqrt(12) if T > 1 else np.full(W.shape[1], np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = (excess.mean(axis=0) * 12) / vol
+        avg_turnover = turnover[start][1:].mean(axis=0) if start.sum() > 1 else np.zeros(W.shape[1])
+
+        result = pd.DataFrame({"Strategy": weights_df.columns.tolist(),
+                               "Rebalancing": frequency,
+                               "Start": dates[0],
+                               "End": dates[-1],
+                               "Total Return": np.round(equity[-1] - 1, 4),
+                               "Annualized Return": np.round(equity[-1]**(1/years) - 1, 4),
+                               "Annualized Volatility": np.round(vol, 4),
+                               "Realized Sharpe": np.round(sharpe, 4),
+                               "Max Drawdown": np.round(drawdown.min(axis=0), 4),
+                               "Avg Turnover per Rebalance": np.round(avg_turnover, 4)})
+        self.results = pd.concat([self.results, result], ignore_index=True)
+
+        # Cleaning Memory
+        del rets
+        del R
+        del log_g
+        del cum_log
+        del G
+        del P
+        del P_prev
+        del turnover
+        del equity
+        del drawdown
+
+# -------------------------------------------#
@@ -24,6 +24,7 @@ class Config():
         self.input_cfg = dict()
         self.output_cfg = dict()
         self.summary_cfg = dict()
+        self.cache_cfg = dict()
 
 # -------------------------------------------#
 
@@ -34,7 +35,7 @@ class Config():
         # Open and read the JSON file
         with open(self.config_path, 'r') as file:
             data = json.load(file)
-            # Input Config
+            # Input Config (extension may list several, comma-separated)
             self.input_cfg = {
                 "location": data["locations"]["input"], 
                 "prefix": data["naming_convention"]["input"]["pre"], 
@@ -52,6 +53,10 @@ class Config():
                 "prefix": data["naming_convention"]["summary"]["pre"], 
                 "extension": data["naming_convention"]["summary"]["ext"]
             }
+            # Stage Cache Config:
+            self.cache_cfg = {
+                "location": data["locations"]["cache"]
+            }
             # Function Arguments:
             self.func_args = {
                 "start_cap": data["function_args"]["start_capital"],
@@ -61,13 +66,24 @@ class Config():
                 "port_cap": data["function_args"]["portfolio_capital"],
                 "opt_ret": data["function_args"]["optimizer_return"],
                 "opt_vol": data["function_args"]["optimizer_volatility"],
-                "corr_cutoff": data["function_args"]["correlation_cutoff"]
+                "corr_cutoff": data["function_args"]["correlation_cutoff"],
+                "rebal_freq": data["function_args"]["rebalance_frequency"],
+                "trans_cost": data["function_args"]["transaction_cost"],
+                "wf_train": data["function_args"]["walk_forward_train_years"],
+                "wf_test": data["function_args"]["walk_forward_test_years"],
+                "wf_mode": data["function_args"]["walk_forward_mode"],
+                "panel": data["function_args"]["panel_parser"],
+                "sharded": data["function_args"]["sharded_execution"],
+                "local_workers": data["function_args"]["local_workers"],
+                "risk_freq": data["function_args"]["risk_metric_frequency"],
+                "downside_opt": data["function_args"]["downside_risk_optimizer"]
             }
 
         # Assert configurations are correct
         assert os.path.exists(self.input_cfg["location"]), "Input file location does not exist"
         assert os.path.exists(self.output_cfg["location"]), "Output file location does not exist"
         assert os.path.exists(self.summary_cfg["location"]), "Summary file location does not exist"
+        assert os.path.exists(self.cache_cfg["location"]), "Stage cache location does not exist"
         assert (self.output_cfg["extension"][0] == ".") & (self.input_cfg["extension"][0] == ".") & (self.summary_cfg["extension"][0] == "."), "Input and/or ouput and/or summary configurated extensions do not start with '.'"
         assert self.func_args["start_cap"] > 0, "Starting capital is less than or equal to zero"
         assert self.func_args["port_cap"] > 0, "Portfolio capital is less than or equal to zero"
@@ -75,5 +91,14 @@ class Config():
         assert self.func_args["req_ret"] > 0, "Required return is less than or equal to zero"
         assert self.func_args["rf_rate"] > 0, "Risk-free return is less than or equal to zero"
         assert (self.func_args["corr_cutoff"] > 0) & (self.func_args["corr_cutoff"] < 1), "Correlation cutoff is outside the bounds (0,1)"
+        assert all(f.strip() in ["monthly", "quarterly", "annual"] for f in self.func_args["rebal_freq"].split(",")), "Rebalancing frequencies must be monthly, quarterly, and/or annual"
+        assert self.func_args["trans_cost"] >= 0, "Transaction cost is less than zero"
+        assert (self.func_args["wf_train"] > 0) & (self.func_args["wf_test"] > 0), "Walk-forward train and/or test years are less than or equal to zero"
+        assert self.func_args["wf_mode"] in ["rolling", "expanding"], "Walk-forward mode is not rolling or expanding"
+        assert isinstance(self.func_args["panel"], bool), "Panel parser setting is not true or false"
+        assert isinstance(self.func_args["sharded"], bool), "Sharded execution setting is not true or false"
+        assert isinstance(self.func_args["local_workers"], int) & (self.func_args["local_workers"] >= 0), "Local workers is not a whole number of zero or more"
+        assert self.func_args["risk_freq"] in ["daily", "monthly"], "Risk metric frequency is not daily or monthly"
+        assert isinstance(self.func_args["downside_opt"], bool), "Downside risk optimizer setting is not true or false"
         
 # -------------------------------------------#
\ No newline at end of file
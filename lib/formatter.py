@@ -11,9 +11,9 @@ Purpose: To export the fund history and performance tables as excel documents
 """
 class Formatter():
 
-    def __init__(self, ticker, output_config, summary_config, history_df, reinvestment_df, performance_df):
+    def __init__(self, ticker, output_config, summary_config, history_df, reinvestment_df, performance_df, universe=None):
         """
-        Initializing the attributes of the class
+        Initializing the attributes of the class. The universe name, when given, is added to the summary document names.
         """
         # Dataframe Attributes
         self.hist = history_df
@@ -33,7 +33,8 @@ class Formatter():
         self.sumloc = summary_config["location"]
         self.sumprefix = summary_config["prefix"]
         self.sumext = summary_config["extension"]
-        self.sumname = f"{self.sumprefix}{self.date}{self.sumext}"
+        self.sumtag = f"{universe}-" if universe else ""
+        self.sumname = f"{self.sumprefix}{self.sumtag}{self.date}{self.sumext}"
         self.sumpath = os.path.join(self.sumloc, self.sumname)
 
 # -------------------------------------------#
@@ -56,6 +57,22 @@ class Formatter():
             self.reinv.to_excel(writer, sheet_name = f"Reinvestment_{start_date.replace('/','-')}_{seed_capital}", index=False)
             self.perf.to_excel(writer, sheet_name = f"Performance_{req_ret}", index=False)
 
+# -------------------------------------------#
+
+    def output_rolling(self, rolling_df):
+        """
+        Adds a Rolling_Metrics sheet with the trailing multi-horizon metrics to the ticker's existing excel document.
+        """
+        with pd.ExcelWriter(self.path,
+                            mode="a",
+                            engine="openpyxl",
+                            if_sheet_exists="replace",
+                            date_format="YYYY-MM-DD",
+                            datetime_format="YYYY-MM-DD"
+        ) as writer:
+
+            rolling_df.to_excel(writer, sheet_name = "Rolling_Metrics")
+
 # -------------------------------------------#
 
     def output_summary(self, summary_df, optimized, less_one_year, config):
@@ -73,4 +90,46 @@ class Formatter():
             less_one_year.to_excel(writer, sheet_name = "Funds Started < 1 Year Ago", index=False)
             config.to_excel(writer, sheet_name = "Function Arguments", index=False)
 
+# -------------------------------------------#
+
+    def output_backtest(self, results, equity, drawdown):
+        """
+        Outputs a backtest excel document next to the summary document.
+        Sheets:
+            Backtest Results - realized performance of every strategy and rebalancing frequency
+            Equity_`frequency` - growth of $1 for every strategy
+            Drawdown_`frequency` - drawdown from the running peak for every strategy
+        """
+        backtest_path = os.path.join(self.sumloc, f"{self.sumprefix}{self.sumtag}backtest-{self.date}{self.sumext}")
+
+        with pd.ExcelWriter(backtest_path,
+                            date_format="YYYY-MM-DD",
+                            datetime_format="YYYY-MM-DD"
+        ) as writer:
+
+            results.to_excel(writer, sheet_name = "Backtest Results", index=False)
+            for freq in equity:
+                equity[freq].to_excel(writer, sheet_name = f"Equity_{freq}")
+                drawdown[freq].to_excel(writer, sheet_name = f"Drawdown_{freq}")
+
+# -------------------------------------------#
+
+    def output_walk_forward(self, results, weights):
+        """
+        Outputs a walk-forward excel document next to the summary document.
+        Sheets:
+            Walk-Forward Results - in-sample expectations and out-of-sample performance per window and strategy
+            Walk-Forward Weights - optimized weights per window and strategy
+        """
+        wf_path = os.path.join(self.sumloc, f"{self.sumprefix}{self.sumtag}walk-forward-{self.date}{self.sumext}")
+
+        with pd.ExcelWriter(wf_path,
+                            date_format="YYYY-MM-DD",
+                            datetime_format="YYYY-MM-DD"
+        ) as writer:
+
+            results.to_excel(writer, sheet_name = "Walk-Forward Results", index=False)
+            weights.to_excel(writer, sheet_name = "Walk-Forward Weights", index=False)
+
+
 
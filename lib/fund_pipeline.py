@@ -0,0 +1,92 @@
+"""
+Import Statements Necessary for Running the Per-Ticker Pipeline Stages
+"""
+import socket
+import os
+import traceback
+from lib.scraper import Scraper
+from lib.parser import Parser
+# -------------------------------------------#
+"""
+Class: FundPipeline
+Purpose: To run the per-ticker Scraper and Parser stages through the stage graph, from the main script or from a sharded worker
+"""
+class FundPipeline():
+
+    def __init__(self, graph, func_args):
+        """
+        Initializing the attributes of the class
+        """
+        self.graph = graph
+        self.func_args = func_args
+        self.worker = f"{socket.gethostname()}-{os.getpid()}"
+
+# -------------------------------------------#
+
+    def fetch(self, ticker, date):
+        """
+        Returns the Scraper for a ticker. Data is refetched once per date.
+        """
+        def fetch_stage():
+            scrape = Scraper()
+            scrape.get_data(ticker)
+            scrape.ticker = None # yfinance Ticker objects hold a live session and are not stored
+            return scrape
+
+        return self.graph.run("fetch", ticker, {"ticker": ticker, "date": date}, fetch_stage)
+
+# -------------------------------------------#
+
+    def parse(self, ticker, scrape):
+        """
+        Returns a Parser with the monthly data, reinvestment metrics, and performance of a ticker.
+        """
+        parse = Parser(scrape, scrape.prices)
+
+        def monthly_stage():
+            parse.get_monthly_data()
+            return parse.monthly_data
+
+        def reinvestment_stage():
+            parse.get_reinvestment_metrics(self.func_args["start_cap"], self.func_args["start_dt"])
+            return {attr: getattr(parse, attr) for attr in ["reinvestment_data", "start", "start_date", "start_shares", "start_val", "start_tz"]}
+
+        def performance_stage():
+            parse.get_performance(self.func_args["req_ret"])
+            return parse.investment_performance
+
+        parse.monthly_data = self.graph.run("monthly", ticker, {"fetch": scrape}, monthly_stage)
+        reinvestment = self.graph.run("reinvestment", ticker, {"fetch": scrape, "monthly": parse.monthly_data}, reinvestment_stage)
+        for attr in reinvestment:
+            setattr(parse, attr, reinvestment[attr])
+        parse.investment_performance = self.graph.run("performance", ticker, {"fetch": scrape, "monthly": parse.monthly_data, "reinvestment": reinvestment}, performance_stage)
+
+        return parse
+
+# -------------------------------------------#
+
+    def work(self, queue, run_id):
+        """
+        Claims tickers of a run from the work queue until none are left, running the per-ticker stages for each one into the
+        shared stage store (only the fetch in panel mode, where parsing happens for all funds at once).
+        Returns the number of tickers completed and failed by this worker.
+        """
+        done = 0
+        failed = 0
+        item = queue.claim(self.worker, run_id)
+        while item is not None:
+            run_id, ticker, date = item
+            try:
+                scrape = self.fetch(ticker, date)
+                if not self.func_args["panel"]:
+                    self.parse(ticker, scrape)
+                queue.complete(run_id, ticker)
+                done += 1
+            except Exception as e:
+                queue.fail(run_id, ticker, traceback.format_exc())
+                failed += 1
+            item = queue.claim(self.worker, run_id)
+
+        return done, failed
+
+# -------------------------------------------#
@@ -0,0 +1,303 @@
+"""
+Import Statements Necessary for Evaluating All Funds as Date x Ticker Arrays
+"""
+import pandas as pd
+from datetime import datetime as dt
+import numpy as np
+# -------------------------------------------#
+"""
+Class: PanelParser
+Purpose: To calculate the Parser monthly data, reinvestment metrics, and yearly performance for every fund at once from aligned date x ticker arrays
+"""
+class PanelParser():
+
+    def __init__(self, prices, dividends):
+        """
+        Initializing the attributes of the class.
+            prices - dictionary of Open/High/Low/Close/Adj Close/Volume dataframes (daily dates x tickers), NaN before inception
+            dividends - dataframe of dividend amounts (daily dates x tickers), NaN where no dividend was paid
+        Each fund's differing history is handled through masks of where it has prices and dividends.
+        """
+        # Datetime attributes
+        self.now = dt.now()
+
+        # Aligned Arrays
+        self.fields = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+        close = prices["Close"].sort_index()
+        self.dates = close.index
+        self.tickers = close.columns.tolist()
+        self.prices = {f: prices[f].reindex(index=self.dates, columns=self.tickers).to_numpy(dtype=float) for f in self.fields}
+        self.dividends = dividends.reindex(index=self.dates, columns=self.tickers).to_numpy(dtype=float)
+        self.valid = ~np.isnan(self.prices["Close"])
+        self.div_mask = ~np.isnan(self.dividends)
+        self.cols = np.arange(len(self.tickers))
+
+        # Attribute Placeholders (per-fund outputs are keyed by ticker)
+        self.monthly_data = dict()
+        self.reinvestment_data = dict()
+        self.investment_performance = dict()
+        self.start_date = dict()
+        self.start_shares = dict()
+        self.start_val = dict()
+
+# -------------------------------------------#
+
+    def _round(self, x, n=2):
+        """
+        Rounds an array exactly like the built-in round used by Parser. np.round only differs on values within
+        floating point error of a half, so those few values are rounded individually.
+        """
+        x = np.asarray(x, dtype=float)
+        out = np.round(x, n)
+        scaled = np.abs(x) * 10**n
+        tie = np.isfinite(x) & (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+        if tie.any():
+            out[tie] = [round(float(v), n) for v in x[tie]]
+        return out
+
+# -------------------------------------------#
+
+    def get_monthly_data(self):
+        """
+        Calculates Parser.get_monthly_data for every fund. Each month is a contiguous block of rows, so the monthly
+        aggregates are ufunc reductions over the blocks with rows outside each fund's history masked out.
+        Months with dividends but no prices (which Parser cannot date) are left out.
+        """
+        # Step 1: Month Blocks (current month removed)
+        keep = (self.dates.year != self.now.year) | (self.dates.month != self.now.month)
+        rows = np.where(keep)[0]
+        key = (self.dates.year.to_numpy()*12 + self.dates.month.to_numpy() - 1)[rows]
+        days = self.dates.day.to_numpy()[rows]
+        starts = np.concatenate(([0], np.where(np.diff(key) != 0)[0] + 1)).astype(int)
+        n_rows = len(rows)
+
+        P = {f: self.prices[f][rows] for f in self.fields}
+        valid = self.valid[rows]
+        D = self.dividends[rows]
+        div_mask = self.div_mask[rows]
+        row_idx = np.broadcast_to(np.arange(n_rows)[:, None], valid.shape)
+
+        # Step 2: Price Aggregates
+        if n_rows > 0:
+            first = np.minimum.reduceat(np.where(valid, row_idx, n_rows), starts, axis=0)
+            last = np.maximum.reduceat(np.where(valid, row_idx, -1), starts, axis=0)
+            has_price = first < n_rows
+            first_c = np.where(has_price, first, 0)
+            last_c = np.where(has_price, last, 0)
+
+            agg = {"Open": P["Open"][first_c, self.cols],
+                   "High": np.fmax.reduceat(P["High"], starts, axis=0),
+                   "Low": np.fmin.reduceat(P["Low"], starts, axis=0),
+                   "Close": P["Close"][last_c, self.cols],
+                   "Adj Close": P["Adj Close"][last_c, self.cols],
+                   "Volume": np.add.reduceat(np.where(valid, P["Volume"], 0), starts, axis=0)}
+            day_begin = days[first_c]
+
+            # Step 3: Dividend Aggregates
+            div_sum = np.add.reduceat(np.where(div_mask, D, 0), starts, axis=0)
+            last_div = np.maximum.reduceat(np.where(div_mask, row_idx, -1), starts, axis=0)
+            has_div = last_div >= 0
+            day_div = days[np.where(has_div, last_div, 0)]
+        else:
+            has_price = np.zeros((0, len(self.tickers)), dtype=bool)
+            agg = {f: np.zeros((0, len(self.tickers))) for f in self.fields}
+            day_begin = day_div = div_sum = agg["Open"]
+            has_div = has_price
+
+        # Step 4: Month Attributes Kept for the Reinvestment and Performance Calculations
+        self.month_key = key[starts] if n_rows > 0 else key
+        self.month_year = self.month_key // 12
+        self.month_month = self.month_key % 12 + 1
+        self.month_close = np.where(has_price, agg["Close"], np.nan)
+        self.month_has = has_price
+
+        # Step 5: Per-Fund Tables
+        for j, ticker in enumerate(self.tickers):
+            m = has_price[:, j]
+            date = pd.to_datetime(pd.DataFrame({"year": self.month_year[m], "month": self.month_month[m], "day": day_begin[m, j]}))
+            prev_div = pd.to_datetime(pd.DataFrame({"year": self.month_year[m], "month": self.month_month[m], "day": np.where(has_div[m, j], day_div[m, j], 1)}))
+            frame = pd.DataFrame({"Open": agg["Open"][m, j],
+                                  "High": agg["High"][m, j],
+                                  "Low": agg["Low"][m, j],
+                                  "Close": agg["Close"][m, j],
+                                  "Adj Close": agg["Adj Close"][m, j],
+                                  "Volume": agg["Volume"][m, j].astype(np.int64),
+                                  "Prev Div Date": prev_div.where(has_div[m, j], pd.NaT).to_numpy(),
+                                  "Dividends": np.where(has_div[m, j], div_sum[m, j], np.nan)},
+                                 index=pd.DatetimeIndex(date, name="Date"))
+            self.monthly_data[ticker] = frame
+
+# -------------------------------------------#
+
+    def get_reinvestment_metrics(self, start_val, start_date):
+        """
+        Calculates Parser.get_reinvestment_metrics for every fund. Share counts carry over month to month (rounded
+        to cents, as in Parser), so the months are stepped through in order with every fund updated at once.
+        """
+        # Step 1: Find Starting Date, Price, and Shares for Every Fund
+        self.start = dt.strptime(start_date, "%m/%d/%Y")
+        C = self.prices["Close"]
+        after = (self.dates >= self.start)[:, None] & self.valid
+        has_start = after.any(axis=0)
+        p_idx = np.argmax(after, axis=0)
+        start_price = np.where(has_start, C[p_idx, self.cols], np.nan)
+        shares0 = np.trunc(start_val / start_price)
+        value0 = shares0*start_price
+        start_dates = self.dates[p_idx]
+        start_key = np.where(has_start, start_dates.year.to_numpy()*12 + start_dates.month.to_numpy() - 1, np.iinfo(np.int64).max)
+
+        ## Dividend Rows After the Start Date, Grouped by Month
+        div_rows = np.where(self.div_mask.any(axis=1) & (self.dates > self.start))[0]
+        div_keys = self.dates.year.to_numpy()[div_rows]*12 + self.dates.month.to_numpy()[div_rows] - 1
+
+        # Step 2: Stepping Through the Months
+        M = len(self.month_key)
+        N = len(self.tickers)
+        out = {name: np.full((M, N), np.nan) for name in ["Dividend Value", "Shares Purchased", "Month-End Value", "Ending Shares"]}
+        active = self.month_has & (self.month_key[:, None] >= start_key[None, :])
+        shares = shares0.copy()
+
+        for m in range(M):
+            dividend_val = np.zeros(N)
+            shares_purchased = np.zeros(N)
+            for r in div_rows[div_keys == self.month_key[m]]:
+                event = active[m] & self.div_mask[r]
+                dividend_val = np.where(event, dividend_val + self.dividends[r]*shares, dividend_val)
+                shares_purchased = np.where(event, shares_purchased + dividend_val/C[r], shares_purchased)
+
+            ending_shares = shares_purchased + shares
+            month_end_val = self.month_close[m]*ending_shares
+            a = active[m]
+            out["Dividend Value"][m, a] = self._round(dividend_val[a])
+            out["Shares Purchased"][m, a] = self._round(shares_purchased[a])
+            out["Ending Shares"][m, a] = self._round(ending_shares[a])
+            out["Month-End Value"][m, a] = self._round(month_end_val[a])
+            shares = np.where(a, out["Ending Shares"][m], shares)
+
+        self.month_active = active
+        self.month_value = out["Month-End Value"]
+        self.start_price = start_price
+        self.shares0 = shares0
+        self.value0 = value0
+        self.start_dates = start_dates
+        self.has_start = has_start
+
+        # Step 3: Per-Fund Tables
+        for j, ticker in enumerate(self.tickers):
+            a = active[:, j]
+            self.start_date[ticker] = start_dates[j] if has_start[j] else pd.NaT
+            self.start_shares[ticker] = shares0[j]
+            self.start_val[ticker] = value0[j]
+            self.reinvestment_data[ticker] = pd.DataFrame({"Date": self.monthly_data[ticker].index[a[self.month_has[:, j]]],
+                                                           "Dividend Value": out["Dividend Value"][a, j],
+                                                           "Shares Purchased": out["Shares Purchased"][a, j],
+                                                           "Month-End Value": out["Month-End Value"][a, j],
+                                                           "Ending Shares": out["Ending Shares"][a, j]})
+
+# -------------------------------------------#
+
+    def get_performance(self, required_ret):
+        """
+        Calculates Parser.get_performance for every fund on a shared year grid, masking each fund to the years from
+        its start date up to (not including) its last year of prices. Running geometric averages come from cumulative
+        log sums, so they match statistics.geometric_mean up to floating point summation order. Dividend dates are
+        compared as calendar days.
+        """
+        # Step 1: Year Grid and Masks
+        years = self.dates.year.to_numpy()
+        N = len(self.tickers)
+        if len(years) == 0:
+            grid = np.array([], dtype=np.int64)
+            base = 0
+        else:
+            grid = np.arange(years.min(), years.max() + 1)
+            base = grid[0]
+        Y = len(grid)
+        year_has = np.zeros((Y, N), dtype=bool)
+        np.logical_or.at(year_has, years - base, self.valid)
+        last_year = np.where(year_has.any(axis=0), base + Y - 1 - np.argmax(year_has[::-1], axis=0), 0)
+        start_year = np.where(self.has_start, self.start_dates.year.to_numpy(), np.iinfo(np.int64).max)
+        included = year_has & (grid[:, None] >= start_year[None, :]) & (grid[:, None] < last_year[None, :])
+
+        ## December Closes and Month-End Values
+        dec_close = np.full((Y, N), np.nan)
+        dec_value = np.full((Y, N), np.nan)
+        dec = self.month_month == 12
+        dec_close[self.month_year[dec] - base] = self.month_close[dec]
+        dec_value[self.month_year[dec] - base] = np.where(self.month_active[dec], self.month_value[dec], np.nan)
+
+        # Step 2: Yearly Dividends Compounded at the Required Return
+        ## Parser pairs the k-th dividend of a year with the k-th dividend of the fund's whole history, which is kept as-is
+        r_idx, j_idx = np.nonzero(self.div_mask)
+        order = np.lexsort((r_idx, j_idx))
+        r_idx = r_idx[order]
+        j_idx = j_idx[order]
+        ev_year = years[r_idx]
+        pos = np.arange(len(r_idx))
+        new_fund = np.concatenate(([True], j_idx[1:] != j_idx[:-1]))
+        new_group = new_fund | np.concatenate(([True], ev_year[1:] != ev_year[:-1]))
+        fund_first = np.maximum.accumulate(np.where(new_fund, pos, 0)) if len(pos) > 0 else pos
+        group_first = np.maximum.accumulate(np.where(new_group, pos, 0)) if len(pos) > 0 else pos
+        paired = fund_first + (pos - group_first)
+        amount = self.dividends[r_idx[paired], j_idx[paired]]
+        eoy = (ev_year + 1 - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+        days = (eoy - self.dates.to_numpy()[r_idx].astype("datetime64[D]")).astype(np.int64)
+
+        div_yr = np.zeros((Y, N))
+        np.add.at(div_yr, (ev_year - base, j_idx), (self.shares0[j_idx] * amount) * (1 + ((required_ret/100)*(days / 365))))
+
+        # Step 3: Stepping Through the Years for Every Fund at Once
+        cols = {name: np.full((Y, N), np.nan) for name in ["Cost Basis w/ Reinvestment", "Rate w/ Reinvestment", "Geometric Return w/ Reinvestment",
+                                                          "Cost Basis w/ Required Return", "Rate w/ Required Return", "Geometric Return w/ Required Return"]}
+        div_total_val = np.zeros(N)
+        first = np.ones(N, dtype=bool)
+        log_nr = np.zeros(N)
+        log_r = np.zeros(N)
+        count = np.zeros(N)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for y in range(Y):
+                inc = included[y]
+                prev_close = dec_close[y-1] if y > 0 else np.full(N, np.nan)
+                prev_value = dec_value[y-1] if y > 0 else np.full(N, np.nan)
+
+                ## Required Return
+                p_0 = np.where(first, self.start_price*self.shares0, prev_close*self.shares0)
+                p_1 = dec_close[y]*self.shares0
+                div_pool_ret = div_total_val*(required_ret/100)
+                div_pool_w = (div_total_val) / (div_total_val + p_0)
+                total_nr = ((1-div_pool_w)*((p_1 - p_0 + div_yr[y]) / p_0)) + (div_pool_w*(required_ret/100))
+
+                ## Reinvestment
+                q_0 = np.where(first, self.value0, prev_value)
+                q_1 = dec_value[y]
+                total_r = ((q_1 - q_0) / q_0)
+
+                ## Running Geometric Averages (first year is not included, as in Parser)
+                later = inc & ~first
+                log_nr = np.where(later, log_nr + np.log(1 + total_nr), log_nr)
+                log_r = np.where(later, log_r + np.log(1 + total_r), log_r)
+                count = np.where(later, count + 1, count)
+
+                cols["Cost Basis w/ Required Return"][y] = np.where(inc, p_0 + div_total_val, np.nan)
+                cols["Rate w/ Required Return"][y] = np.where(inc, total_nr*100, np.nan)
+                cols["Geometric Return w/ Required Return"][y] = np.where(later, np.exp(log_nr / count) - 1, np.nan)
+                cols["Cost Basis w/ Reinvestment"][y] = np.where(inc, q_0, np.nan)
+                cols["Rate w/ Reinvestment"][y] = np.where(inc, total_r*100, np.nan)
+                cols["Geometric Return w/ Reinvestment"][y] = np.where(later, np.exp(log_r / count) - 1, np.nan)
+
+                div_total_val = np.where(inc, div_total_val + (div_pool_ret + div_yr[y]), div_total_val)
+                first = first & ~inc
+
+        # Step 4: Per-Fund Tables
+        for j, ticker in enumerate(self.tickers):
+            inc = included[:, j]
+            self.investment_performance[ticker] = pd.DataFrame({"Year": grid[inc].tolist(),
+                                                                "Cost Basis w/ Reinvestment": cols["Cost Basis w/ Reinvestment"][inc, j],
+                                                                "Rate w/ Reinvestment": cols["Rate w/ Reinvestment"][inc, j],
+                                                                "Geometric Return w/ Reinvestment": cols["Geometric Return w/ Reinvestment"][inc, j],
+                                                                "Cost Basis w/ Required Return": cols["Cost Basis w/ Required Return"][inc, j],
+                                                                "Rate w/ Required Return": cols["Rate w/ Required Return"][inc, j],
+                                                                "Geometric Return w/ Required Return": cols["Geometric Return w/ Required Return"][inc, j]})
+
+# -------------------------------------------#
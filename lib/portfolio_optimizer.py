@@ -1,8 +1,13 @@
 """
 Import Statements Necessary for Optimization of FI Portfolio
 """
+import os
+import json
+import time
+import hashlib
 import pandas as pd
 import numpy as np
+import scipy.optimize as sco
 from pypfopt.efficient_frontier import EfficientFrontier
 from pypfopt import objective_functions
 # -------------------------------------------#
@@ -12,41 +17,158 @@ Purpose: To find the optimized weights of funds ran through the fund_returns pro
 """
 class portfolioOptimizer():
 
-    def __init__(self, rf_rate):
-
+    def __init__(self, rf_rate, cache_path=None, universe=None):
+        """
+        Initializing the attributes of the class. When a cache_path is given, solutions from previous runs are loaded
+        from it (keyed by universe, strategy, and target) and every new solution is saved to it. A cache file that cannot
+        be read is treated as empty.
+        """
         # Initializing Attributes
         self.rf_rate = rf_rate/100
+        self.cache_path = cache_path
+        self.universe = universe
+        self.stats = list()
         self.weights = pd.DataFrame()
         self.strategy = list()
         self.return_list = list()
         self.risk = list()
         self.sharpe = list()
 
+        # Loading Stored Solutions
+        self.solutions = dict()
+        if (cache_path is not None) and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r') as file:
+                    self.solutions = json.load(file)
+            except ValueError:
+                self.solutions = dict()
+
 # -------------------------------------------#
 
-    def maximize_Sharpe(self, return_df, cov_df):
+    def fingerprint(self, strategy, return_df, cov_df, target):
         """
-        Optimizes portfolio weights for the maximum Sharpe ratio,
+        Hashes everything a solve depends on: strategy, target, risk-free rate, tickers, expected returns, and covariance.
+        """
+        tickers = list(return_df.index)
+        h = hashlib.sha256()
+        h.update(repr((strategy, target, self.rf_rate, tickers)).encode())
+        h.update(np.ascontiguousarray(np.asarray(return_df, dtype=float)).tobytes())
+        h.update(np.ascontiguousarray(pd.DataFrame(cov_df).loc[tickers, tickers].to_numpy(dtype=float)).tobytes())
+        return h.hexdigest()
+
+# -------------------------------------------#
+
+    def solve(self, strategy, label, weight_col, return_df, cov_df, target=None):
+        """
+        Solves one strategy, reusing the stored solution for this universe, strategy, and target:
+            Cache Hit - inputs are identical to the stored solve, so the stored weights and performance are used
+            Warm Start - inputs changed, so the problem is re-solved from the stored weights (see warm_start)
+            Solved - there is no stored solution, or the warm start did not converge, so the problem is solved from scratch
+        Solve time and solver iterations are recorded in self.stats.
         """
-        # Creating EfficientFrontier Instance and Calculating Weights
-        ef = EfficientFrontier(return_df, cov_df)
-        ef.add_objective(objective_functions.L2_reg)
-        ef.max_sharpe(risk_free_rate = self.rf_rate)
-
-        # Cleaning and Saving Weights
-        ef.clean_weights()
-        sharpe_weights = ef.weights
-        sharpe_tickers = ef.tickers
-
-        # Getting Optimized Portfolio Performance
-        expected_return, volatility, sharpe = ef.portfolio_performance(risk_free_rate=self.rf_rate)
-        self.strategy.append('Max. Sharpe')
+        # Step 1: Looking Up the Stored Solution
+        tickers = list(return_df.index)
+        key = f"{self.universe}|{strategy}|{target}"
+        fp = self.fingerprint(strategy, return_df, cov_df, target)
+        prev = self.solutions.get(key)
+        start = time.perf_counter()
+
+        if (prev is not None) and (prev["fingerprint"] == fp):
+            status = "Cache Hit"
+            iterations = 0
+            weights = prev["weights"]
+            expected_return, volatility, sharpe = prev["performance"]
+
+        # Step 2: Solving and Storing the New Solution
+        else:
+            ef = EfficientFrontier(return_df, cov_df)
+            ef.add_objective(objective_functions.L2_reg)
+            result = self.warm_start(strategy, ef, prev, target) if prev is not None else None
+
+            if result is not None:
+                status = "Warm Start"
+                ef.set_weights(dict(zip(tickers, result.x)))
+                iterations = int(result.nit)
+            else:
+                status = "Solved"
+                if strategy == "max_sharpe":
+                    ef.max_sharpe(risk_free_rate = self.rf_rate)
+                elif strategy == "efficient_risk":
+                    ef.efficient_risk(target/100)
+                else:
+                    ef.efficient_return(target/100)
+                iterations = ef._opt.solver_stats.num_iters
+
+            # Cleaning and Saving Weights
+            ef.clean_weights()
+            weights = [float(w) for w in ef.weights]
+
+            # Getting Optimized Portfolio Performance
+            expected_return, volatility, sharpe = ef.portfolio_performance(risk_free_rate=self.rf_rate)
+
+            ## Storing the Solution for the Next Run
+            self.solutions[key] = {"fingerprint": fp, "tickers": tickers, "weights": weights,
+                                   "performance": [float(expected_return), float(volatility), float(sharpe)]}
+            ## (written to a temporary file first, then swapped in, so an interrupted write cannot leave a truncated cache)
+            if self.cache_path is not None:
+                tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as file:
+                    json.dump(self.solutions, file)
+                os.replace(tmp_path, self.cache_path)
+
+        # Step 3: Recording Performance and Solve Statistics
+        self.strategy.append(label)
         self.return_list.append(expected_return)
         self.risk.append(volatility)
         self.sharpe.append(sharpe)
+        self.stats.append({"Strategy": label, "Solve Status": status, "Solve Time (s)": round(time.perf_counter() - start, 4), "Solver Iterations": iterations})
 
         # Returning Tickers and Weights
-        return pd.DataFrame({"Ticker": list(sharpe_tickers), "Sharpe Weights": list(sharpe_weights)})
+        return pd.DataFrame({"Ticker": tickers, weight_col: weights})
+
+# -------------------------------------------#
+
+    def warm_start(self, strategy, ef, prev, target):
+        """
+        Re-solves a strategy with SLSQP starting from the stored weights (new tickers start at zero), since the convex
+        solvers used by EfficientFrontier cannot be given a starting point. The objective is the same one in weight space:
+            max_sharpe - negative Sharpe ratio
+            efficient_risk - negative return, with volatility at most the target
+            efficient_return - variance, with return at least the target
+        plus the L2 regularization of the cold solve. Max-Sharpe is not rescaled as in EfficientFrontier.max_sharpe, so its
+        warm-started weights can differ slightly from a cold solve. Returns the scipy result, or None if it did not converge.
+        """
+        # Step 1: Starting Point From the Stored Weights
+        tickers = list(ef.tickers)
+        prev_weights = dict(zip(prev["tickers"], prev["weights"]))
+        x0 = np.clip(np.array([prev_weights.get(t, 0.0) for t in tickers], dtype=float), 0, 1)
+        x0 = x0 / x0.sum() if x0.sum() > 0 else np.full(len(tickers), 1/len(tickers))
+
+        # Step 2: Objective and Constraints
+        mu = np.asarray(ef.expected_returns, dtype=float)
+        S = np.asarray(ef.cov_matrix, dtype=float)
+        constraints = [{"type": "eq", "fun": lambda w: w.sum() - 1}]
+        if strategy == "max_sharpe":
+            objective = lambda w: -(w @ mu - self.rf_rate) / np.sqrt(w @ S @ w) + w @ w
+        elif strategy == "efficient_risk":
+            objective = lambda w: -(w @ mu) + w @ w
+            constraints.append({"type": "ineq", "fun": lambda w: (target/100)**2 - w @ S @ w})
+        else:
+            objective = lambda w: w @ S @ w + w @ w
+            constraints.append({"type": "ineq", "fun": lambda w: w @ mu - target/100})
+
+        # Step 3: Solving
+        result = sco.minimize(objective, x0, method="SLSQP", bounds=[(0, 1)]*len(tickers), constraints=constraints)
+
+        return result if result.success else None
+
+# -------------------------------------------#
+
+    def maximize_Sharpe(self, return_df, cov_df):
+        """
+        Optimizes portfolio weights for the maximum Sharpe ratio,
+        """
+        return self.solve("max_sharpe", 'Max. Sharpe', "Sharpe Weights", return_df, cov_df)
 
 # -------------------------------------------#
 
@@ -54,25 +176,7 @@ class portfolioOptimizer():
         """
         Optimizes porfolio weights to acheive a maximum return with a given required variance.
         """
-        # Creating EfficientFrontier Instance and Calculating Weights
-        ef = EfficientFrontier(return_df, cov_df)
-        ef.add_objective(objective_functions.L2_reg)
-        ef.efficient_risk(req_vol/100)
-
-        # Cleaning and Saving Weights
-        ef.clean_weights()
-        max_ret_weights = ef.weights
-        max_ret_tickers = ef.tickers
-
-        # Getting Optimized Portfolio Performance
-        expected_return, volatility, sharpe = ef.portfolio_performance(risk_free_rate=self.rf_rate)
-        self.strategy.append(f'Max. Ret w/ Required Var = {req_vol}')
-        self.return_list.append(expected_return)
-        self.risk.append(volatility)
-        self.sharpe.append(sharpe)
-
-        # Returning Tickers and Weights
-        return pd.DataFrame({"Ticker": list(max_ret_tickers), "Max Return Weights": list(max_ret_weights)})
+        return self.solve("efficient_risk", f'Max. Ret w/ Required Var = {req_vol}', "Max Return Weights", return_df, cov_df, req_vol)
     
 # -------------------------------------------#
 
@@ -80,23 +184,4 @@ class portfolioOptimizer():
         """
         Optimizes portfolio weights to achieve a minimum volatility given a required return.
         """
-        # Creating EfficientFrontier Instance and Calculating Weights
-        ef = EfficientFrontier(return_df, cov_df)
-        ef.add_objective(objective_functions.L2_reg)
-        ef.efficient_return(req_ret/100)
-
-        # Cleaning and Saving Weights
-        ef.clean_weights()
-        min_vol_weights = ef.weights
-        min_vol_tickers = ef.tickers
-
-
-        # Getting Optimized Portfolio Performance
-        expected_return, volatility, sharpe = ef.portfolio_performance(risk_free_rate=self.rf_rate)
-        self.strategy.append(f'Min. Vol w/ Required Ret = {req_ret}')
-        self.return_list.append(expected_return)
-        self.risk.append(volatility)
-        self.sharpe.append(sharpe)
-
-        # Returning Tickers and Weights
-        return pd.DataFrame({"Ticker": list(min_vol_tickers), "Min Volatility Weights": list(min_vol_weights)})
\ No newline at end of file
+        return self.solve("efficient_return", f'Min. Vol w/ Required Ret = {req_ret}', "Min Volatility Weights", return_df, cov_df, req_ret)
@@ -0,0 +1,88 @@
+"""
+Import Statements Necessary for Reading Fund Universe Input Files
+"""
+import os
+import csv
+import re
+from openpyxl import load_workbook
+# -------------------------------------------#
+"""
+Class: Reader
+Purpose: To read every fund universe file in the input location and deduplicate their tickers
+"""
+class Reader():
+
+    def __init__(self, input_config):
+        """
+        Initializing the attributes of the class
+        """
+        # Input Attributes
+        self.loc = input_config["location"]
+        self.prefix = input_config["prefix"]
+        self.extensions = [ext.strip() for ext in input_config["extension"].split(",")]
+        self.readers = {".xlsx": self.read_xlsx, ".csv": self.read_csv, ".txt": self.read_txt}
+
+        # Attribute Placeholders
+        self.universes = dict()
+        self.tickers = list()
+
+# -------------------------------------------#
+
+    def get_universes(self):
+        """
+        Reads each input file following the naming convention `prefix``universe``extension` into a list of tickers.
+        Tickers are stripped and upper-cased, kept in file order, and deduplicated within and across universes.
+        """
+        # Step 1: Find Input Files
+        files = sorted(f for f in os.listdir(self.loc) if not f.startswith((".", "~$")))
+        assert len(files) > 0, "No input files in the directory"
+        for f in files:
+            ext = os.path.splitext(f)[1].lower()
+            assert f.startswith(self.prefix) and (ext in self.extensions), f"Naming Convention is Incorrect: {f}"
+            assert ext in self.readers, f"Unsupported input file type: {f}"
+
+        # Step 2: Read Each Universe
+        for f in files:
+            name = os.path.splitext(f)[0][len(self.prefix):]
+            raw = self.readers[os.path.splitext(f)[1].lower()](os.path.join(self.loc, f))
+            tickers = [str(t).strip().upper() for t in raw if (t is not None) and (str(t).strip() != "")]
+            self.universes[name] = list(dict.fromkeys(tickers))
+
+        # Step 3: Distinct Tickers Across All Universes
+        self.tickers = list(dict.fromkeys(t for name in self.universes for t in self.universes[name]))
+
+# -------------------------------------------#
+
+    def read_xlsx(self, path):
+        """
+        Reads the 'Tickers' column of the first sheet in read-only mode.
+        """
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            header = list(next(rows))
+            assert "Tickers" in header, f"No 'Tickers' column in {path}"
+            col = header.index("Tickers")
+            return [row[col] for row in rows if len(row) > col]
+        finally:
+            wb.close()
+
+    def read_csv(self, path):
+        """
+        Reads the 'Tickers' column of a csv file.
+        """
+        with open(path, 'r', newline='', encoding='utf-8-sig') as file:
+            reader = csv.DictReader(file)
+            assert "Tickers" in reader.fieldnames, f"No 'Tickers' column in {path}"
+            return [row["Tickers"] for row in reader]
+
+    def read_txt(self, path):
+        """
+        Reads tickers separated by new lines, commas, or whitespace. Lines starting with '#' and a 'Tickers' header are ignored.
+        """
+        with open(path, 'r', encoding='utf-8-sig') as file:
+            lines = [line.split("#")[0] for line in file]
+        tickers = [t for line in lines for t in re.split(r'[\s,]+', line) if t != ""]
+        return [t for t in tickers if t != "Tickers"]
+
+# -------------------------------------------#
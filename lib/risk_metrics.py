@@ -0,0 +1,140 @@
+"""
+Import Statements Necessary for Drawdown and Downside-Risk Metrics
+"""
+import pandas as pd
+import numpy as np
+from pypfopt.risk_models import fix_nonpositive_semidefinite
+# -------------------------------------------#
+"""
+Class: RiskMetrics
+Purpose: To calculate drawdown and downside-risk metrics from the daily or monthly total returns of all funds at once
+"""
+class RiskMetrics():
+
+    def __init__(self, returns_df, rf_rate, periods_per_year=12):
+        """
+        Initializing the attributes of the class.
+            returns_df - simple total returns (dates x tickers), e.g. RollingMetrics.returns or daily total returns
+            rf_rate - annual risk-free rate in percent, also used as the minimum acceptable return for downside risk
+            periods_per_year - 12 for monthly returns, 252 for daily returns
+        """
+        # Input Attributes
+        self.returns = returns_df.sort_index()
+        self.rf_rate = rf_rate/100
+        self.periods = periods_per_year
+        self.mar = (1 + self.rf_rate)**(1/periods_per_year) - 1
+
+        # Attribute Placeholders
+        self.metrics = pd.DataFrame()
+
+# -------------------------------------------#
+
+    def get_risk_metrics(self):
+        """
+        Calculates the following columns for every fund with running-max array operations over the whole return matrix:
+            - Max Drawdown (largest fall of the total return index from its running peak)
+            - Max Drawdown Duration (Days) (longest calendar time spent below a previous peak)
+            - Recovery Time (Days) (calendar time from the bottom of the max drawdown back to its peak, blank if not yet recovered)
+            - Downside Deviation (annualized root mean square of returns below the risk-free rate)
+            - Sortino Ratio (annualized return in excess of the risk-free rate over downside deviation)
+            - Calmar Ratio (annualized return over max drawdown, using the fund's full history)
+        """
+        # Step 1: Return Matrix
+        R = self.returns.to_numpy(dtype=float)
+        rows, cols = R.shape
+        valid = ~np.isnan(R)
+        clean = np.where(valid, R, 0)
+        days = self.returns.index.values.astype("datetime64[D]").astype(np.int64)
+        idx = np.arange(rows)[:, None]
+
+        ## Last Observation of Each Fund (the index stays flat afterwards and is not counted as underwater)
+        last_valid = rows - 1 - np.argmax(valid[::-1], axis=0)
+
+        # Step 2: Total Return Index and Drawdowns
+        wealth = np.cumprod(1 + clean, axis=0)
+        peak = np.maximum.accumulate(wealth, axis=0)
+        drawdown = wealth / peak - 1
+        at_peak = wealth >= peak
+        max_dd = drawdown.min(axis=0)
+
+        ## Drawdown Duration (days since the most recent peak at every date)
+        last_peak = np.maximum.accumulate(np.where(at_peak, idx, 0), axis=0)
+        underwater = np.where(idx <= last_valid, days[:, None] - days[last_peak], 0)
+        duration = underwater.max(axis=0).astype(float)
+
+        ## Recovery Time (first peak after the trough of the max drawdown)
+        trough = drawdown.argmin(axis=0)
+        recovered = at_peak & (idx > trough)
+        first = recovered.argmax(axis=0)
+        recovery = np.where(recovered.any(axis=0), days[first] - days[trough], np.nan)
+        recovery = np.where(max_dd < 0, recovery, 0)
+
+        # Step 3: Downside Deviation and Risk-Adjusted Returns
+        n = valid.sum(axis=0)
+        downside = np.where(valid, np.minimum(R - self.mar, 0), 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            down_dev = np.sqrt((downside**2).sum(axis=0) / n * self.periods)
+            ann_ret = np.exp(np.log1p(clean).sum(axis=0) * self.periods / n) - 1
+            sortino = (ann_ret - self.rf_rate) / down_dev
+            calmar = np.where(max_dd < 0, ann_ret / -max_dd, np.nan)
+
+        ## Funds Without Returns
+        empty = n == 0
+        for arr in [max_dd, duration, recovery, calmar]:
+            arr[empty] = np.nan
+
+        self.metrics = pd.DataFrame({"Ticker": self.returns.columns.tolist(),
+                                     "Max Drawdown": np.round(max_dd, 4),
+                                     "Max Drawdown Duration (Days)": duration,
+                                     "Recovery Time (Days)": recovery,
+                                     "Downside Deviation": np.round(down_dev, 4),
+                                     "Sortino Ratio": np.round(sortino, 4),
+                                     "Calmar Ratio": np.round(calmar, 4)})
+
+        # Cleaning Memory
+        del R
+        del clean
+        del wealth
+        del peak
+        del drawdown
+        del at_peak
+        del last_peak
+        del underwater
+        del recovered
+        del downside
+
+# -------------------------------------------#
+
+    def get_semicovariance(self, tickers):
+        """
+        Returns the annualized semicovariance of returns below the risk-free rate for the given tickers, so the optimizer
+        can measure risk as downside deviation. Each pair uses the dates where both funds have a return.
+        Funds that share no dates with another fund are left out (the one missing the most pairs, then the one with the
+        fewest returns, first), and the matrix is made positive semidefinite because pairwise estimates may not be.
+        """
+        # Step 1: Downside Returns and Shared Dates of Each Pair
+        R = self.returns[tickers].to_numpy(dtype=float)
+        valid = ~np.isnan(R)
+        D = np.where(valid, np.minimum(R - self.mar, 0), 0)
+        V = valid.astype(float)
+        shared = V.T @ V
+
+        ## Leaving Out Funds Without Shared Dates
+        keep = np.ones(len(tickers), dtype=bool)
+        while keep.any():
+            kept = np.where(keep)[0]
+            missing = (shared[np.ix_(kept, kept)] == 0).sum(axis=1)
+            if missing.max() == 0:
+                break
+            keep[kept[np.lexsort((shared.diagonal()[kept], -missing))[0]]] = False
+
+        # Step 2: Annualized Semicovariance
+        kept = np.where(keep)[0]
+        names = [tickers[k] for k in kept]
+        S = pd.DataFrame((D[:, kept].T @ D[:, kept]) / shared[np.ix_(kept, kept)] * self.periods, index=names, columns=names)
+        if len(names) > 1:
+            S = fix_nonpositive_semidefinite(S)
+
+        return S
+
+# -------------------------------------------#
@@ -0,0 +1,129 @@
+"""
+Import Statements Necessary for Rolling Multi-Horizon Return Metrics
+"""
+import pandas as pd
+import numpy as np
+# -------------------------------------------#
+"""
+Class: RollingMetrics
+Purpose: To calculate trailing annualized total return, volatility, and dividend yield at every month-end for all funds at once
+"""
+class RollingMetrics():
+
+    def __init__(self, horizons=(1, 3, 5, 10)):
+        """
+        Initializing the attributes of the class. Horizons are given in years.
+        """
+        # Horizon Attributes
+        self.horizons = list(horizons)
+
+        # Attribute Placeholders
+        self.closes = dict()
+        self.dividends = dict()
+        self.metrics = dict()
+        self.latest = pd.DataFrame()
+        self.returns = pd.DataFrame()
+
+# -------------------------------------------#
+
+    def add_fund(self, ticker, monthly_data):
+        """
+        Stores a fund's month-end close and monthly dividend total (keyed by month) from Parser.monthly_data
+        """
+        month = monthly_data.index.to_period("M")
+        keep = ~month.duplicated(keep="last")
+        self.closes[ticker] = pd.Series(monthly_data["Close"].to_numpy()[keep], index=month[keep])
+        self.dividends[ticker] = pd.Series(monthly_data["Dividends"].fillna(0).to_numpy()[keep], index=month[keep])
+
+# -------------------------------------------#
+
+    def get_rolling_metrics(self):
+        """
+        Calculates the trailing metrics for every horizon, month-end, and fund from cumulative sums in a single pass.
+        Per-fund dataframe columns (for each horizon h):
+            - hY Ann. Return (annualized total return with dividends reinvested)
+            - hY Volatility (annualized standard deviation of monthly log total returns)
+            - hY Div Yield (trailing dividends per year over month-end close)
+        A value is only reported when the full window of monthly returns is available.
+        """
+
+        # Step 1: Align All Funds on a Common Monthly Calendar
+        close = pd.DataFrame(self.closes).sort_index()
+        div = pd.DataFrame(self.dividends).reindex(close.index).fillna(0)
+        dates = close.index.to_timestamp(how="end").normalize()
+        c = close.to_numpy(dtype=float)
+        d = div.to_numpy(dtype=float)
+        rows, cols = c.shape
+
+        # Step 2: Monthly Log Total Returns
+        log_ret = np.full((rows, cols), np.nan)
+        if rows > 1:
+            log_ret[1:] = np.log((c[1:] + d[1:]) / c[:-1])
+        valid = ~np.isnan(log_ret)
+        clean = np.where(valid, log_ret, 0)
+
+        ## Simple Monthly Total Returns (kept for the backtester)
+        self.returns = pd.DataFrame(np.exp(log_ret) - 1, index=dates, columns=close.columns)
+        self.returns.index.name = "Date"
+
+        ## Cumulative Sums (leading zero row so every window sum is a single subtraction)
+        zeros = np.zeros((1, cols))
+        cum_ret = np.vstack((zeros, np.cumsum(clean, axis=0)))
+        cum_sq = np.vstack((zeros, np.cumsum(clean**2, axis=0)))
+        cum_n = np.vstack((zeros, np.cumsum(valid, axis=0)))
+        cum_div = np.vstack((zeros, np.cumsum(d, axis=0)))
+
+        # Step 3: Window Sums per Horizon
+        results = dict()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for h in self.horizons:
+                m = 12*h
+                ann_ret = np.full((rows, cols), np.nan)
+                vol = np.full((rows, cols), np.nan)
+                yld = np.full((rows, cols), np.nan)
+
+                if rows >= m:
+                    s = cum_ret[m:] - cum_ret[:-m]
+                    sq = cum_sq[m:] - cum_sq[:-m]
+                    n = cum_n[m:] - cum_n[:-m]
+                    dv = cum_div[m:] - cum_div[:-m]
+                    full = n == m
+
+                    ann_ret[m-1:] = np.where(full, np.exp(s / h) - 1, np.nan)
+                    var = np.maximum((sq - (s**2)/m) / (m - 1), 0)
+                    vol[m-1:] = np.where(full, np.sqrt(var*12), np.nan)
+                    yld[m-1:] = np.where(full, (dv / h) / c[m-1:], np.nan)
+
+                results[f"{h}Y Ann. Return"] = ann_ret
+                results[f"{h}Y Volatility"] = vol
+                results[f"{h}Y Div Yield"] = yld
+
+        # Step 4: Splitting Into Per-Fund Tables and Latest Values
+        latest_l = list()
+        for idx, ticker in enumerate(close.columns):
+            fund = pd.DataFrame({col: results[col][:, idx] for col in results}, index=dates)
+            fund.index.name = "Date"
+            fund = fund.loc[~np.isnan(c[:, idx])].round(4)
+            self.metrics[ticker] = fund
+
+            last = fund.iloc[-1:].reset_index(drop=True) if fund.shape[0] > 0 else pd.DataFrame(columns=fund.columns, index=[0])
+            last.insert(0, "Ticker", ticker)
+            latest_l.append(last)
+
+        if len(latest_l) > 0:
+            self.latest = pd.concat(latest_l, ignore_index=True)
+
+        # Cleaning Memory
+        del close
+        del div
+        del c
+        del d
+        del log_ret
+        del clean
+        del cum_ret
+        del cum_sq
+        del cum_n
+        del cum_div
+        del results
+
+# -------------------------------------------#
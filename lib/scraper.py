@@ -17,6 +17,8 @@ class Scraper():
         # Attribute Placeholders
         self.ticker = None
         self.prices = None
+        self.dividends = None
+        self.info = None
 
 # -------------------------------------------#
 
@@ -34,4 +36,8 @@ class Scraper():
         # Step 2: Validate the Ticker Exists
         assert self.ticker.history(period = 'max').shape[0] > 0, f"{ticker} not found in YFinance"
 
+        # Step 3: Keep the Dividend History and Info Independently of the Ticker Instance
+        self.dividends = self.ticker.dividends
+        self.info = self.ticker.info
+
 # -------------------------------------------#
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Import Statements Necessary for Dependency-Tracked Stage Caching
+"""
+import os
+import pickle
+import hashlib
+import pandas as pd
+import numpy as np
+# -------------------------------------------#
+"""
+Class: StageGraph
+Purpose: To fingerprint each pipeline stage by the content of its inputs and its configuration so a rerun only recomputes stages whose fingerprints changed
+"""
+class StageGraph():
+
+    def __init__(self, cache_config, func_args):
+        """
+        Initializing the attributes of the class and the stage graph.
+        Each stage lists the inputs it is fingerprinted on and the function arguments (from config.json) it depends on.
+        A stage's version is raised when a fix changes its output for the same inputs, so stored outputs are recomputed.
+        Artifact stages write files and are fingerprinted on the path they write to (so a new location, name, or date is
+        written), and are rerun if the file they wrote no longer exists.
+        Each output is stored together with its fingerprint in one file that is replaced atomically, so several
+        processes (e.g. sharded workers) can share the same store.
+        """
+        # Stage Graph
+        self.stages = {
+            "fetch": {"inputs": ["ticker", "date"], "config": [], "artifact": False},
+            "monthly": {"inputs": ["fetch"], "config": [], "artifact": False},
+            "reinvestment": {"inputs": ["fetch", "monthly"], "config": ["start_cap", "start_dt"], "artifact": False},
+            "performance": {"inputs": ["fetch", "monthly", "reinvestment"], "config": ["req_ret"], "artifact": False},
+            "panel": {"inputs": ["fetch"], "config": ["start_cap", "start_dt", "req_ret"], "artifact": False},
+            "rolling": {"inputs": ["monthly"], "config": [], "artifact": False},
+            "risk": {"inputs": ["total_returns"], "config": ["rf_rate", "risk_freq"], "artifact": False},
+            "report": {"inputs": ["target", "monthly", "reinvestment", "performance", "rolling"], "config": ["start_cap", "start_dt", "req_ret"], "artifact": True},
+            "covariance": {"inputs": ["yearly_returns"], "config": [], "artifact": False},
+            "backtest": {"inputs": ["monthly_returns", "weights"], "config": ["rf_rate", "trans_cost", "rebal_freq"], "artifact": False},
+            "walk_forward": {"inputs": ["monthly_returns"], "config": ["rf_rate", "opt_ret", "wf_train", "wf_test", "wf_mode"], "artifact": False, "version": 3},
+            "summary": {"inputs": ["target", "summary", "optimized", "less_one_year", "configuration", "backtest", "walk_forward"], "config": [], "artifact": True}
+        }
+
+        # Store Attributes
+        self.loc = cache_config["location"]
+        self.func_args = func_args
+
+        # Run Statistics
+        self.computed = list()
+        self.skipped = list()
+
+# -------------------------------------------#
+
+    def content_hash(self, obj):
+        """
+        Returns a SHA-256 hex digest of an object's content. Dataframes and series are hashed row-wise by pandas,
+        containers are hashed element by element, and other objects by their attributes or repr.
+        """
+        h = hashlib.sha256()
+        self._update(h, obj)
+        return h.hexdigest()
+
+    def _update(self, h, obj):
+        """
+        Recursively feeds an object's content into the hash.
+        """
+        h.update(type(obj).__name__.encode())
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            if isinstance(obj, pd.DataFrame):
+                h.update(repr(obj.columns.tolist()).encode())
+            try:
+                h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+            except TypeError:
+                h.update(obj.to_csv().encode())
+        elif isinstance(obj, np.ndarray):
+            h.update(repr(obj.shape).encode())
+            h.update(np.ascontiguousarray(obj).tobytes())
+        elif isinstance(obj, dict):
+            for key in sorted(obj, key=str):
+                h.update(repr(key).encode())
+                self._update(h, obj[key])
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                self._update(h, item)
+        elif hasattr(obj, "__dict__"):
+            self._update(h, vars(obj))
+        else:
+            h.update(repr(obj).encode())
+
+# -------------------------------------------#
+
+    def fingerprint(self, stage, inputs):
+        """
+        Fingerprints a stage from its name, its configuration values, and the content of its declared inputs.
+        """
+        assert stage in self.stages, f"Unknown stage: {stage}"
+        missing = [name for name in self.stages[stage]["inputs"] if name not in inputs]
+        assert len(missing) == 0, f"Stage {stage} is missing inputs: {missing}"
+
+        parts = {"stage": stage,
+                 "config": {key: self.func_args[key] for key in self.stages[stage]["config"]},
+                 "inputs": {name: self.content_hash(inputs[name]) for name in self.stages[stage]["inputs"]}}
+        if "version" in self.stages[stage]:
+            parts["version"] = self.stages[stage]["version"]
+        return self.content_hash(parts)
+
+# -------------------------------------------#
+
+    def run(self, stage, scope, inputs, func):
+        """
+        Returns the output of a stage for a scope (a ticker or a universe). The stored output is reused when the
+        fingerprint matches the previous run, otherwise func is called and its output stored with the new fingerprint.
+        Artifact stages return the path of the file they wrote.
+        """
+        fp = self.fingerprint(stage, inputs)
+        key = f"{stage}|{scope}"
+        path = os.path.join(self.loc, stage, f"{scope}.pkl")
+
+        # Step 1: Reusing the Stored Output if Nothing Changed
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                stored = pickle.load(file)
+            stored_fp, output = stored if isinstance(stored, tuple) and (len(stored) == 2) else (None, None)
+            if (stored_fp == fp) and ((not self.stages[stage]["artifact"]) or os.path.exists(output)):
+                self.skipped.append(key)
+                return output
+
+        # Step 2: Recomputing and Storing (written to a temporary file first, then swapped in)
+        output = func()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            pickle.dump((fp, output), file)
+        os.replace(tmp_path, path)
+        self.computed.append(key)
+
+        return output
+
+# -------------------------------------------#
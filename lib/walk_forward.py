@@ -0,0 +1,190 @@
+"""
+Import Statements Necessary for Walk-Forward Portfolio Optimization
+"""
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import pandas as pd
+import numpy as np
+from pypfopt.risk_models import fix_nonpositive_semidefinite
+from lib.portfolio_optimizer import portfolioOptimizer
+# -------------------------------------------#
+"""
+Worker State and Functions
+Purpose: Each pool process attaches once to the shared read-only return matrix and solves windows against it
+"""
+_worker = dict()
+
+def _init_worker(shm_name, shape, dtype, tickers, first, mode, train_len, periods, rf_rate, opt_ret):
+    """
+    Attaches the worker process to the shared return matrix and stores the optimization arguments.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["returns"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker["tickers"] = np.array(tickers)
+    _worker["first"] = first
+    _worker["mode"] = mode
+    _worker["train_len"] = train_len
+    _worker["periods"] = periods
+    _worker["rf_rate"] = rf_rate
+    _worker["opt_ret"] = opt_ret
+
+def _solve_window(window):
+    """
+    Estimates expected returns and covariance on the training rows, optimizes, and evaluates the weights on the following test rows.
+    Funds are included when they have returns on every training row and at least the training length (train_years) of them.
+    In expanding mode a fund's history starts at its own first return, so younger funds join once they have train_years of
+    returns, and the covariance of funds with different starts uses the rows they share. Missing test returns (e.g. closed
+    funds) are treated as cash.
+    """
+    train_start, train_end, test_end = window
+    R = _worker["returns"]
+    periods = _worker["periods"]
+    train = R[train_start:train_end]
+
+    ## Training Rows of Each Fund
+    start = np.maximum(_worker["first"], train_start) if _worker["mode"] == "expanding" else np.full(R.shape[1], train_start)
+    in_hist = np.arange(train_start, train_end)[:, None] >= start[None, :]
+    keep = ~(np.isnan(train) & in_hist).any(axis=0) & (train_end - start >= _worker["train_len"])
+    train = np.where(in_hist, train, np.nan)[:, keep]
+    test = np.nan_to_num(R[train_end:test_end][:, keep])
+    tickers = _worker["tickers"][keep]
+
+    # Step 1: Annualized In-Sample Estimates
+    ret_s = pd.Series(np.exp(np.nanmean(np.log1p(train), axis=0)*periods) - 1, index=tickers)
+    cov_df = pd.DataFrame(train, columns=tickers).cov()*periods
+    if (_worker["mode"] == "expanding") and (len(tickers) > 1):
+        cov_df = fix_nonpositive_semidefinite(cov_df)
+
+    # Step 2: Optimizing and Evaluating Out-of-Sample
+    opt = portfolioOptimizer(_worker["rf_rate"])
+    strategies = {"Sharpe": lambda: opt.maximize_Sharpe(ret_s, cov_df),
+                  "Min Volatility": lambda: opt.minimize_volatility(ret_s, cov_df, _worker["opt_ret"])}
+    rows = list()
+    weights = list()
+    for name in strategies:
+        row = {"Strategy": name, "Funds": len(tickers)}
+        try:
+            assert len(tickers) > 1, "Fewer than two funds with a full training history"
+            w_df = strategies[name]()
+            w = w_df.iloc[:, 1].to_numpy(dtype=float)
+            port = test @ w
+            row["Expected Return"] = opt.return_list[-1]
+            row["Expected Volatility"] = opt.risk[-1]
+            row["OOS Return"] = np.exp(np.log1p(port).mean()*periods) - 1
+            row["OOS Volatility"] = port.std(ddof=1)*np.sqrt(periods) if len(port) > 1 else np.nan
+            row["OOS Sharpe"] = (row["OOS Return"] - _worker["rf_rate"]/100) / row["OOS Volatility"] if row["OOS Volatility"] > 0 else np.nan
+            row["Status"] = "OK"
+            weights.append(pd.DataFrame({"Strategy": name, "Ticker": w_df["Ticker"], "Weight": w}))
+        except Exception as e:
+            row["Status"] = f"Failed - {e}"
+        rows.append(row)
+
+    return rows, weights
+
+# -------------------------------------------#
+"""
+Class: WalkForward
+Purpose: To re-optimize portfolios on rolling or expanding historical windows and evaluate each on the following window
+"""
+class WalkForward():
+
+    def __init__(self, returns_df, rf_rate, periods_per_year=12):
+        """
+        Initializing the attributes of the class.
+            returns_df - period total returns (dates x tickers), e.g. RollingMetrics.returns or the yearly return matrix
+                         (rows where no fund has a return, such as the first month, are dropped)
+            rf_rate - annual risk-free rate in percent
+            periods_per_year - 12 for monthly returns, 1 for yearly returns
+        """
+        # Input Attributes
+        self.returns = returns_df.dropna(how="all")
+        self.rf_rate = rf_rate
+        self.periods = periods_per_year
+
+        # Attribute Placeholders
+        self.mode = "rolling"
+        self.train_len = 0
+        self.windows = list()
+        self.results = pd.DataFrame()
+        self.weights = pd.DataFrame()
+
+# -------------------------------------------#
+
+    def get_windows(self, train_years, test_years, mode="rolling"):
+        """
+        Builds (train start, train end, test end) row positions. Windows step forward by the test length.
+            rolling - training window has a fixed length of train_years
+            expanding - training window starts at the first row (or at each fund's first return, see _solve_window)
+        """
+        assert mode in ["rolling", "expanding"], f"Invalid walk-forward mode: {mode}"
+        train_len = int(train_years*self.periods)
+        test_len = int(test_years*self.periods)
+        assert (train_len > 1) & (test_len > 0), "Walk-forward train and test windows are too short"
+
+        self.mode = mode
+        self.train_len = train_len
+        self.windows = list()
+        train_end = train_len
+        while train_end + test_len <= self.returns.shape[0]:
+            train_start = train_end - train_len if mode == "rolling" else 0
+            self.windows.append((train_start, train_end, train_end + test_len))
+            train_end += test_len
+
+# -------------------------------------------#
+
+    def run(self, opt_ret, max_workers=None):
+        """
+        Solves every window concurrently in a process pool. The return matrix is placed in shared memory once so
+        workers read it without copying. Results have one row per window and strategy.
+        """
+        # Step 1: Placing Returns in Shared Memory
+        R = np.ascontiguousarray(self.returns.to_numpy(dtype=float))
+        shm = shared_memory.SharedMemory(create=True, size=max(R.nbytes, 1))
+        shared = np.ndarray(R.shape, dtype=R.dtype, buffer=shm.buf)
+        shared[:] = R[:]
+        first = np.argmax(~np.isnan(R), axis=0) if R.shape[0] > 0 else np.zeros(R.shape[1], dtype=int)
+        initargs = (shm.name, R.shape, R.dtype, self.returns.columns.tolist(), first, self.mode, self.train_len, self.periods, self.rf_rate, opt_ret)
+
+        # Step 2: Solving Windows (the script has no __main__ guard, so a pool is only used where processes fork)
+        try:
+            if "fork" in multiprocessing.get_all_start_methods():
+                with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                         mp_context=multiprocessing.get_context("fork"),
+                                         initializer=_init_worker,
+                                         initargs=initargs) as pool:
+                    solved = list(pool.map(_solve_window, self.windows))
+            else:
+                _init_worker(*initargs)
+                solved = [_solve_window(window) for window in self.windows]
+                worker_shm = _worker.pop("shm")
+                _worker.clear()
+                worker_shm.close()
+        finally:
+            del shared
+            shm.close()
+            shm.unlink()
+
+        # Step 3: Formatting Results
+        dates = self.returns.index
+        rows_l = list()
+        weights_l = list()
+        for idx, (window, (rows, weights)) in enumerate(zip(self.windows, solved)):
+            train_start, train_end, test_end = window
+            for row in rows:
+                rows_l.append({"Window": idx + 1,
+                               "Train Start": dates[train_start],
+                               "Train End": dates[train_end - 1],
+                               "Test End": dates[test_end - 1],
+                               **row})
+            for w in weights:
+                w.insert(0, "Window", idx + 1)
+                weights_l.append(w)
+
+        self.results = pd.DataFrame(rows_l).round(4)
+        if len(weights_l) > 0:
+            self.weights = pd.concat(weights_l, ignore_index=True).round(4)
+
+# -------------------------------------------#
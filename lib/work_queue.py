@@ -0,0 +1,129 @@
+"""
+Import Statements Necessary for the SQLite Ticker Work Queue
+"""
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime as dt
+# -------------------------------------------#
+"""
+Class: WorkQueue
+Purpose: To hand out tickers to any number of worker processes or nodes through a SQLite file, with no external services
+"""
+class WorkQueue():
+
+    def __init__(self, queue_path, lease_minutes=30, max_attempts=3):
+        """
+        Initializing the attributes of the class and creating the queue table if needed.
+            lease_minutes - a claimed ticker is handed out again if its worker has not finished it within this time
+            max_attempts - a ticker is marked failed after this many claims without completing
+        The queue file must be on a filesystem every worker can reach with working file locks.
+        """
+        # Queue Attributes
+        self.path = queue_path
+        self.lease = lease_minutes*60
+        self.max_attempts = max_attempts
+
+        # Creating the Queue Table
+        with closing(self.connect()) as con:
+            con.execute("""CREATE TABLE IF NOT EXISTS items (
+                               id INTEGER PRIMARY KEY AUTOINCREMENT,
+                               run_id TEXT NOT NULL,
+                               ticker TEXT NOT NULL,
+                               date TEXT NOT NULL,
+                               status TEXT NOT NULL DEFAULT 'pending',
+                               worker TEXT,
+                               attempts INTEGER NOT NULL DEFAULT 0,
+                               claimed_at REAL,
+                               error TEXT,
+                               UNIQUE (run_id, ticker))""")
+
+# -------------------------------------------#
+
+    def connect(self):
+        """
+        Opens a connection that waits on other writers instead of failing immediately.
+        """
+        return sqlite3.connect(self.path, timeout=60, isolation_level=None)
+
+# -------------------------------------------#
+
+    def enqueue(self, tickers, date):
+        """
+        Adds one work item per ticker under a new run id and returns the run id.
+        """
+        run_id = dt.strftime(dt.now(), "%Y%m%d_%H%M%S_%f")
+        with closing(self.connect()) as con:
+            con.execute("BEGIN IMMEDIATE")
+            con.executemany("INSERT OR IGNORE INTO items (run_id, ticker, date) VALUES (?, ?, ?)", [(run_id, t, date) for t in tickers])
+            con.execute("COMMIT")
+        return run_id
+
+# -------------------------------------------#
+
+    def latest_run(self):
+        """
+        Returns the id of the most recently queued run, or None if the queue is empty.
+        """
+        with closing(self.connect()) as con:
+            return con.execute("SELECT MAX(run_id) FROM items").fetchone()[0]
+
+    def claim(self, worker, run_id):
+        """
+        Claims the oldest pending item of a run, or a running item whose lease has expired (its worker is assumed dead).
+        Items left over from earlier runs are never handed out, so they cannot overwrite current results with old dates.
+        Returns (run_id, ticker, date) or None.
+        """
+        now = time.time()
+        with closing(self.connect()) as con:
+            con.execute("BEGIN IMMEDIATE")
+            con.execute("""UPDATE items SET status = 'failed', error = 'Lease expired on the last attempt'
+                           WHERE run_id = ? AND status = 'running' AND claimed_at < ? AND attempts >= ?""", (run_id, now - self.lease, self.max_attempts))
+            row = con.execute("""SELECT id, run_id, ticker, date FROM items
+                                 WHERE run_id = ? AND (status = 'pending' OR (status = 'running' AND claimed_at < ?))
+                                 ORDER BY id LIMIT 1""", (run_id, now - self.lease)).fetchone()
+            if row is None:
+                con.execute("COMMIT")
+                return None
+            con.execute("UPDATE items SET status = 'running', worker = ?, attempts = attempts + 1, claimed_at = ? WHERE id = ?", (worker, now, row[0]))
+            con.execute("COMMIT")
+        return row[1:]
+
+# -------------------------------------------#
+
+    def complete(self, run_id, ticker):
+        """
+        Marks an item done.
+        """
+        with closing(self.connect()) as con:
+            con.execute("UPDATE items SET status = 'done', error = NULL WHERE run_id = ? AND ticker = ?", (run_id, ticker))
+
+    def fail(self, run_id, ticker, error):
+        """
+        Records an error and returns the item to the queue, or marks it failed once it has used all its attempts.
+        """
+        with closing(self.connect()) as con:
+            con.execute("""UPDATE items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, error = ?
+                           WHERE run_id = ? AND ticker = ?""", (self.max_attempts, error, run_id, ticker))
+
+# -------------------------------------------#
+
+    def progress(self, run_id):
+        """
+        Returns the number of items in each status for a run.
+        """
+        with closing(self.connect()) as con:
+            rows = con.execute("SELECT status, COUNT(*) FROM items WHERE run_id = ? GROUP BY status", (run_id,)).fetchall()
+        counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def failed(self, run_id):
+        """
+        Returns the tickers of a run that used all their attempts, with the last error recorded for each.
+        """
+        with closing(self.connect()) as con:
+            rows = con.execute("SELECT ticker, error FROM items WHERE run_id = ? AND status = 'failed' ORDER BY id", (run_id,)).fetchall()
+        return dict(rows)
+
+# -------------------------------------------#